@@ -0,0 +1,5 @@
+# With BENCH_PARALLEL_FRAMES=1, pin inner OpenMP/BLAS/Numba pools to one
+# thread before anything in the package imports NumPy (see bench._threads).
+from ._threads import set_inner_thread_env as _set_inner_thread_env
+
+_set_inner_thread_env()
@@ -0,0 +1,28 @@
+"""
+Optional Numba support for the Camera MTF Bench.
+
+Numba is not a hard dependency: every JIT kernel in this package has a
+NumPy/OpenCV fallback, and callers check `HAVE_NUMBA` to pick a path.
+
+When Numba is missing, `njit` becomes a no-op decorator and `prange` is
+plain `range`, so kernels still import (and even run, slowly) everywhere.
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit, prange  # type: ignore[import]
+
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+__all__ = ["HAVE_NUMBA", "njit", "prange"]
@@ -0,0 +1,74 @@
+"""
+Thread limits for frame-level parallelism in the Camera MTF Bench.
+
+When I parallelize over frames (thread pools around per-frame decode or
+metric work), OpenCV, OpenMP/BLAS and Numba would each start their own
+worker threads *inside* every frame task as well. The nested pools
+oversubscribe the cores and throughput collapses.
+
+Setting `BENCH_PARALLEL_FRAMES=1` opts into the outer-parallel mode: I pin
+those inner libraries to one thread each, so all parallelism comes from the
+frame level. Without the variable nothing changes.
+
+The environment variables only take effect if they are set before NumPy /
+Numba are first imported, so `bench/__init__.py` applies them on package
+import; OpenCV's pool is pinned at runtime by `limit_inner_threads()`.
+"""
+
+from __future__ import annotations
+
+import os
+
+PARALLEL_FRAMES_ENV = "BENCH_PARALLEL_FRAMES"
+
+# Thread-count variables read once by the inner libraries at import time.
+_INNER_THREAD_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "NUMBA_NUM_THREADS",
+)
+
+
+def parallel_frames_enabled() -> bool:
+    """True if `BENCH_PARALLEL_FRAMES` is set to a truthy value."""
+    value = os.environ.get(PARALLEL_FRAMES_ENV, "")
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def set_inner_thread_env() -> None:
+    """
+    Default the inner libraries' thread-count variables to 1.
+
+    Explicit user settings win (setdefault). No-op unless parallel-frames
+    mode is enabled.
+    """
+    if not parallel_frames_enabled():
+        return
+    for var in _INNER_THREAD_VARS:
+        os.environ.setdefault(var, "1")
+
+
+def limit_inner_threads() -> bool:
+    """
+    Pin OpenCV (and the env-configured libraries) to one thread each.
+
+    Returns True if parallel-frames mode is enabled and limits were applied.
+    """
+    if not parallel_frames_enabled():
+        return False
+
+    set_inner_thread_env()
+
+    import cv2
+
+    cv2.setNumThreads(1)
+    return True
+
+
+__all__ = [
+    "PARALLEL_FRAMES_ENV",
+    "parallel_frames_enabled",
+    "set_inner_thread_env",
+    "limit_inner_threads",
+]
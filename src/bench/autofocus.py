@@ -3,10 +3,14 @@ Autofocus utilities for the Camera MTF Bench.
 
 I keep this module intentionally small and focused:
 - `scan_autofocus` handles the *general* stage+camera autofocus workflow.
+- `scan_autofocus_goldensection` is the same workflow with a golden-section
+  search, for hardware where every grab costs real time.
+- `FocusSweepPipeline` runs the same scan with acquisition and metric
+  computation overlapped on two threads.
 - `scan_autofocus_stack_siemens` handles the *simulated* case where the
   focus sweep is represented by a folder of Siemens-star images.
 
-Both functions return the same AFResult dataclass so that higher-level
+All of them return the same AFResult dataclass so that higher-level
 pipelines (e.g., `workflows.py` or `workflows_hardware.py`) can treat
 autofocus results uniformly.
 """
@@ -14,11 +18,14 @@ autofocus results uniformly.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Tuple
+from typing import Callable, Sequence, Tuple
+import inspect
+import threading
 
 import numpy as np
 
 from .instruments import Stage, Camera
+from .metrics import tenengrad_sobel
 
 
 # ---------------------------------------------------------------------------
@@ -55,22 +62,69 @@ class AFResult:
 
     metrics : np.ndarray
         1D array of focus metric values corresponding to positions_um.
+
+    best_index : int, optional
+        Index of the best sample in positions_um / metrics.
+
+    best_image : np.ndarray, optional
+        The best-focus frame, when the scan already had it in memory (the
+        stack-based scan keeps it so callers need not read it again).
     """
 
     best_z_um: float
     best_metric: float
     positions_um: np.ndarray
     metrics: np.ndarray
+    best_index: int | None = None
+    best_image: np.ndarray | None = None
+
+
+def _af_result_from_trace(positions_arr: np.ndarray, metrics_arr: np.ndarray) -> AFResult:
+    """
+    Build an AFResult from a finished (positions, metrics) trace.
+
+    Every scan strategy ends the same way, so I keep the best-sample
+    selection in one place: one argmax pass, then plain Python floats
+    pulled out with .item() instead of float(array[...]) casts.
+    """
+    best_idx = int(metrics_arr.argmax())
+
+    return AFResult(
+        best_z_um=positions_arr.item(best_idx),
+        best_metric=metrics_arr.item(best_idx),
+        positions_um=positions_arr,
+        metrics=metrics_arr,
+        best_index=best_idx,
+    )
 
 
 # ---------------------------------------------------------------------------
 # 1) Generic autofocus (stage + camera)
 # ---------------------------------------------------------------------------
 
+def _scan_positions(start_um: float, stop_um: float, step_um: float) -> np.ndarray:
+    """
+    Positions of a fixed-step scan from start_um toward stop_um (inclusive-ish).
+
+    The number of samples is fixed by start/stop/step, so I derive every
+    position from its index. This avoids the float drift of accumulating
+    z = z + step_um.
+    """
+    if step_um == 0:
+        raise ValueError("step_um must be non-zero")
+
+    # Validate that step direction actually moves toward stop_um.
+    if (stop_um - start_um) * step_um < 0:
+        raise ValueError("step_um sign does not move from start_um toward stop_um")
+
+    n = int(np.floor((stop_um - start_um) / step_um + 1e-9)) + 1
+    return start_um + np.arange(n, dtype=float) * step_um
+
+
 def scan_autofocus(
     stage: Stage,
     camera: Camera,
-    metric_fn: FocusMetric,
+    metric_fn: FocusMetric | None,
     start_um: float,
     stop_um: float,
     step_um: float,
@@ -95,8 +149,9 @@ def scan_autofocus(
     camera : Camera
         Must implement grab() -> np.ndarray.
 
-    metric_fn : callable
+    metric_fn : callable or None
         Function image -> scalar (e.g., Tenengrad or Siemens metric).
+        If None, I use `tenengrad_sobel` (Numba-fused when available).
 
     start_um : float
         Starting stage position in micrometers.
@@ -115,86 +170,295 @@ def scan_autofocus(
     -------
     AFResult
     """
-    if step_um == 0:
-        raise ValueError("step_um must be non-zero")
+    if metric_fn is None:
+        metric_fn = tenengrad_sobel
 
-    # Validate that step direction actually moves toward stop_um.
-    if (stop_um - start_um) * step_um < 0:
-        raise ValueError("step_um sign does not move from start_um toward stop_um")
-
-    positions = []
-    metrics = []
+    positions_arr = _scan_positions(start_um, stop_um, step_um)
+    metrics_arr = np.empty(positions_arr.size, dtype=float)
 
-    # Move to the starting point
-    stage.move_to(start_um)
-    z = stage.position()
-
-    # Scan loop
-    while True:
-        # End conditions for positive/negative scanning
-        if step_um > 0 and z > stop_um + 1e-9:
-            break
-        if step_um < 0 and z < stop_um - 1e-9:
-            break
+    # Scan loop: a fixed, precomputed sequence with no in-loop end checks.
+    # tolist() hands the stage plain Python floats rather than np.float64.
+    for i, z in enumerate(positions_arr.tolist()):
+        stage.move_to(z)
 
         if settle_callback is not None:
             settle_callback(stage)
 
         img = camera.grab()
-        m = float(metric_fn(img))
+        metrics_arr[i] = float(metric_fn(img))
 
-        positions.append(z)
-        metrics.append(m)
+    return _af_result_from_trace(positions_arr, metrics_arr)
+
+
+# ---------------------------------------------------------------------------
+# 1b) Golden-section autofocus (stage + camera)
+# ---------------------------------------------------------------------------
+
+_INV_PHI = (np.sqrt(5.0) - 1.0) / 2.0  # 1/φ ≈ 0.618
 
-        # Move to the next position
-        z = z + step_um
+
+def quadratic_peak(positions: np.ndarray, metrics: np.ndarray) -> float | None:
+    """
+    Refine a focus peak by fitting a parabola through the three best samples.
+
+    I fit a*z² + b*z + c to the three highest metrics and return the vertex
+    -b / (2a). If the fit is not a downward parabola (a >= 0), or the vertex
+    falls outside the fitted samples, I return None.
+    """
+    positions = np.asarray(positions, dtype=float)
+    metrics = np.asarray(metrics, dtype=float)
+    if positions.size < 3:
+        return None
+
+    top = np.argsort(metrics)[-3:]
+    z, m = positions[top], metrics[top]
+    if np.unique(z).size < 3:
+        return None
+
+    a, b, _ = np.polyfit(z, m, 2)
+    if a >= 0:
+        return None
+
+    z_peak = -b / (2.0 * a)
+    if not (z.min() <= z_peak <= z.max()):
+        return None
+    return float(z_peak)
+
+
+def scan_autofocus_goldensection(
+    stage: Stage,
+    camera: Camera,
+    metric_fn: FocusMetric | None,
+    lo_um: float,
+    hi_um: float,
+    tol_um: float,
+    settle_callback=None,
+    refine: bool = False,
+) -> AFResult:
+    """
+    Golden-section autofocus over [lo_um, hi_um].
+
+    For real hardware each grab costs exposure + transfer + stage motion, so a
+    uniform sweep wastes most of its samples far from focus. Assuming the
+    focus metric is unimodal inside the bracket, I shrink the bracket by 1/φ
+    per iteration with a single new evaluation each time:
+
+        - 2 evaluations to bootstrap the interior points,
+        - then 1 per iteration until hi - lo < tol_um.
+
+    Parameters
+    ----------
+    stage, camera, metric_fn, settle_callback :
+        Same meaning as in `scan_autofocus` (metric_fn=None → tenengrad_sobel).
+
+    lo_um, hi_um : float
+        Search bracket in micrometers (lo_um < hi_um).
+
+    tol_um : float
+        Stop once the bracket is narrower than this.
+
+    refine : bool
+        If True, I fit a parabola through the three best samples
+        (`quadratic_peak`) and take one extra sample at its vertex.
+
+    Returns
+    -------
+    AFResult
+        positions_um/metrics hold every evaluated sample, in evaluation order.
+    """
+    if hi_um <= lo_um:
+        raise ValueError("hi_um must be greater than lo_um")
+    if tol_um <= 0:
+        raise ValueError("tol_um must be positive")
+
+    if metric_fn is None:
+        metric_fn = tenengrad_sobel
+
+    positions: list[float] = []
+    metrics: list[float] = []
+
+    def evaluate(z: float) -> float:
         stage.move_to(z)
+        if settle_callback is not None:
+            settle_callback(stage)
+        m = float(metric_fn(camera.grab()))
+        positions.append(z)
+        metrics.append(m)
+        return m
+
+    a, b = float(lo_um), float(hi_um)
+    c = b - _INV_PHI * (b - a)
+    d = a + _INV_PHI * (b - a)
+    fc = evaluate(c)
+    fd = evaluate(d)
+
+    while b - a > tol_um:
+        if fc > fd:
+            # Peak is in [a, d]: the old c becomes the new d.
+            b, d, fd = d, c, fc
+            c = b - _INV_PHI * (b - a)
+            fc = evaluate(c)
+        else:
+            # Peak is in [c, b]: the old d becomes the new c.
+            a, c, fc = c, d, fd
+            d = a + _INV_PHI * (b - a)
+            fd = evaluate(d)
+
+    if refine:
+        z_peak = quadratic_peak(np.asarray(positions), np.asarray(metrics))
+        if z_peak is not None:
+            evaluate(z_peak)
 
     positions_arr = np.asarray(positions, dtype=float)
     metrics_arr = np.asarray(metrics, dtype=float)
 
-    if metrics_arr.size == 0:
-        raise RuntimeError("No autofocus samples were collected; check scan parameters.")
+    return _af_result_from_trace(positions_arr, metrics_arr)
 
-    best_idx = int(np.argmax(metrics_arr))
-    best_z = float(positions_arr[best_idx])
-    best_m = float(metrics_arr[best_idx])
 
-    return AFResult(
-        best_z_um=best_z,
-        best_metric=best_m,
-        positions_um=positions_arr,
-        metrics=metrics_arr,
-    )
+# ---------------------------------------------------------------------------
+# 1c) Pipelined autofocus (acquisition and metric overlapped)
+# ---------------------------------------------------------------------------
+
+class FocusSweepPipeline:
+    """
+    Double-buffered stage → camera → metric sweep.
+
+    A plain scan is strictly serial: move, settle, grab, compute, repeat.
+    Here an acquisition thread moves the stage and grabs frame k+1 into one
+    buffer while I compute the metric of frame k from the other buffer; then
+    the buffers swap. Stage waits, camera I/O and OpenCV/NumPy metrics all
+    release the GIL, so the two halves genuinely overlap.
+
+    Each buffer has two events: `filled` (frame ready to score) and `free`
+    (metric done, buffer may be overwritten). If the camera's grab() accepts
+    a `dst=` array (e.g. `OpenCVCamera`), frames are grabbed straight into
+    two preallocated buffers; otherwise the buffers just hold references.
+
+    The metric must not keep references to the frame it is given, since the
+    buffer is reused two positions later.
+
+    Parameters
+    ----------
+    stage : Stage
+        Must implement move_to().
+    camera : Camera
+        Must implement grab() (optionally grab(dst=...)).
+    metric_fn : callable or None
+        Function image -> scalar; None means `tenengrad_sobel`. For Siemens
+        targets, pass e.g. functools.partial(siemens_focus_metric, mask=mask).
+    settle_callback : callable, optional
+        Called with the stage after each move, before grabbing.
+    """
+
+    def __init__(
+        self,
+        stage: Stage,
+        camera: Camera,
+        metric_fn: FocusMetric | None = None,
+        settle_callback=None,
+    ) -> None:
+        self.stage = stage
+        self.camera = camera
+        self.metric_fn = metric_fn if metric_fn is not None else tenengrad_sobel
+        self.settle_callback = settle_callback
+        try:
+            self._grab_into = "dst" in inspect.signature(camera.grab).parameters
+        except (TypeError, ValueError):
+            self._grab_into = False
+
+    def run(self, start_um: float, stop_um: float, step_um: float) -> AFResult:
+        """Scan start_um → stop_um like `scan_autofocus`, pipelined."""
+        positions_arr = _scan_positions(start_um, stop_um, step_um)
+        metrics_arr = np.empty(positions_arr.size, dtype=float)
+
+        buffers: list = [None, None]
+        filled = [threading.Event(), threading.Event()]
+        free = [threading.Event(), threading.Event()]
+        free[0].set()
+        free[1].set()
+        stop = threading.Event()
+        errors: list = []
+
+        def acquire() -> None:
+            slot = 0
+            try:
+                for i, z in enumerate(positions_arr.tolist()):
+                    slot = i & 1
+                    free[slot].wait()
+                    free[slot].clear()
+                    if stop.is_set():
+                        return
+
+                    self.stage.move_to(z)
+                    if self.settle_callback is not None:
+                        self.settle_callback(self.stage)
+
+                    if self._grab_into and buffers[slot] is not None:
+                        self.camera.grab(dst=buffers[slot])
+                    else:
+                        # The first grab per buffer also fixes the frame
+                        # shape; after that I grab in place when I can.
+                        buffers[slot] = self.camera.grab()
+                    filled[slot].set()
+            except BaseException as exc:  # re-raised in the calling thread
+                errors.append(exc)
+                filled[slot].set()
+
+        worker = threading.Thread(target=acquire, name="af-acquire", daemon=True)
+        worker.start()
+        try:
+            for i in range(positions_arr.size):
+                slot = i & 1
+                filled[slot].wait()
+                filled[slot].clear()
+                if errors:
+                    raise errors[0]
+                metrics_arr[i] = float(self.metric_fn(buffers[slot]))
+                free[slot].set()
+        finally:
+            # On any failure, wake the acquisition thread so it can exit.
+            stop.set()
+            free[0].set()
+            free[1].set()
+            worker.join()
+
+        return _af_result_from_trace(positions_arr, metrics_arr)
 
 
 # ---------------------------------------------------------------------------
 # 2) Simulated autofocus on a Siemens focus stack
 # ---------------------------------------------------------------------------
 
-from bench.instruments import MockStage, MockCameraFocusStack
-from bench.metrics import siemens_focus_metric
+from bench.instruments import MockStage, open_focus_stack
+from bench.metrics import siemens_focus_metric_stack
+from bench.targets import SiemensParams
 
 
 def scan_autofocus_stack_siemens(
-    stack_pattern: str,
+    stack_pattern: str | Sequence[str],
     z_start_um: float,
     z_end_um: float,
+    params: SiemensParams | None = None,
 ) -> AFResult:
     """
     Autofocus over a symmetric focus stack containing a Siemens star.
 
     This wrapper is designed specifically for simulation pipelines:
-        - I load a stack of images from disk.
+        - I load a stack of images from disk (decoded once, up front).
         - I map frame indices → physical z positions.
-        - I evaluate a Siemens-specific focus metric at each index.
-        - I return the same AFResult dataclass used for real hardware scans.
+        - I evaluate a Siemens-specific focus metric for all frames at once.
+        - I return the same AFResult dataclass used for real hardware scans,
+          with the best-focus frame attached as `best_image`.
 
     Parameters
     ----------
     stack_pattern : str
-        Glob pattern for focus stack frames, e.g. "data/focus_stack/*.png".
-        Frames must be sorted in the same order as defocus.
+        Glob pattern for focus stack frames, e.g. "data/focus_stack/*.png",
+        or a single stack file (video, or an (N, H, W) .npy that is
+        memory-mapped). Frames must be sorted in the same order as defocus.
+        A sequence of frame paths (e.g. from `list_stack_files`) is used
+        in the given order, so a caller that already listed the stack does
+        not pay for a second glob + sort.
 
     z_start_um : float
         Physical stage position corresponding to the first frame (index 0).
@@ -202,12 +466,16 @@ def scan_autofocus_stack_siemens(
     z_end_um : float
         Physical stage position corresponding to the last frame (index N-1).
 
+    params : SiemensParams, optional
+        Star geometry shared by all frames (and reusable for the MTF step).
+        If None, I estimate it once from the first frame.
+
     Returns
     -------
     AFResult
         Dataclass with best focus position, best metric, and full traces.
     """
-    cam = MockCameraFocusStack(stack_pattern)
+    cam = open_focus_stack(stack_pattern)
     stage = MockStage(z0_um=z_start_um)
 
     n = cam.num_frames
@@ -215,28 +483,21 @@ def scan_autofocus_stack_siemens(
         raise ValueError("Need at least two frames in the focus stack for autofocus.")
 
     # Map indices 0..n-1 to linearly spaced z positions
-    positions = np.linspace(z_start_um, z_end_um, n)
-    metrics = []
-
-    for idx, z in enumerate(positions):
-        stage.move_to(z)
-        cam.set_index(idx)
+    positions_arr = np.linspace(z_start_um, z_end_um, n)
 
-        img = cam.grab()
-        m = siemens_focus_metric(img)
+    # The stack is fixed on disk, so I decode it once (on a thread pool,
+    # one worker per core) and score every frame in one batched pass
+    # instead of one metric call per frame.
+    imgs = cam.load_all()
+    metrics_arr = siemens_focus_metric_stack(imgs, params=params)
 
-        metrics.append(m)
+    result = _af_result_from_trace(positions_arr, metrics_arr)
 
-    positions_arr = positions.astype(float)
-    metrics_arr = np.asarray(metrics, dtype=float)
+    # Keep the best frame so the MTF step does not decode it a second time.
+    # A copy, so holding the result does not pin the whole decoded stack.
+    result.best_image = np.array(imgs[result.best_index])
 
-    best_idx = int(np.argmax(metrics_arr))
-    best_z = float(positions_arr[best_idx])
-    best_m = float(metrics_arr[best_idx])
+    # Leave the (mock) stage parked at best focus, as a real sweep would.
+    stage.move_to(result.best_z_um)
 
-    return AFResult(
-        best_z_um=best_z,
-        best_metric=best_m,
-        positions_um=positions_arr,
-        metrics=metrics_arr,
-    )
+    return result
@@ -5,13 +5,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-import numpy as np
-import cv2
-import matplotlib.pyplot as plt  # I rely on matplotlib for quick diagnostic plots
-
-from .autofocus import scan_autofocus_stack_siemens
-from .metrics import mtf_siemens_multi_radius
-from .workflows import run_focus_and_mtf
+# NumPy/OpenCV/matplotlib and the pipeline modules are imported inside the
+# command handlers that need them, so `bench --help` and `bench list-visa`
+# start instantly instead of paying for matplotlib + OpenCV at import time.
 
 
 # ---------------------------------------------------------------------------
@@ -38,6 +34,21 @@ class FocusAndMTFHWConfig:
     out_dir: Path
     dry_run: bool
     camera_index: int
+    # "png" for human inspection; "npy" skips PNG deflate per frame and
+    # loads straight back through MockCameraFocusStack.
+    frame_format: str = "png"
+    # PNG deflate level 0-9 (1 = fast); None keeps OpenCV's default.
+    png_compression: Optional[int] = None
+    # Coarse sweep + spline peak + fine sweep instead of every uniform z.
+    adaptive: bool = False
+    # Longest wait for the stage to settle after a move; None = 0.1 s for
+    # real stages, no wait for the dummy stage.
+    settle_timeout_s: Optional[float] = None
+    # "frames" = one file per frame (in `frame_format`); "npy" / "h5" =
+    # every frame appended to a single frames.npy / frames.h5 container.
+    container: str = "frames"
+    # Stop a uniform sweep once the focus metric has clearly passed its peak.
+    early_stop: bool = False
 
 
 # ---------------------------------------------------------------------------
@@ -63,6 +74,8 @@ def cmd_demo_af(args: argparse.Namespace) -> None:
         python -m bench demo-af --stack 'data/focus_stack/*.png' \
                                 --z-start -200 --z-end 200
     """
+    from .autofocus import scan_autofocus_stack_siemens
+
     pattern = args.stack
     z_start = args.z_start
     z_end = args.z_end
@@ -80,6 +93,8 @@ def cmd_demo_af(args: argparse.Namespace) -> None:
     print(f"[demo-af] Best metric = {result.best_metric:.3e}")
 
     if args.plot:
+        import matplotlib.pyplot as plt  # I rely on matplotlib for quick diagnostic plots
+
         plt.figure()
         plt.plot(result.positions_um, result.metrics, marker="o")
         plt.xlabel("Stage position [µm]")
@@ -98,6 +113,11 @@ def cmd_mtf_siemens(args: argparse.Namespace) -> None:
         python -m bench mtf-siemens --image data/focus_stack/frame_04.png \
                                     --out outputs/mtf_siemens
     """
+    import cv2
+    import numpy as np
+
+    from .metrics import mtf_siemens_multi_radius
+
     img_path = Path(args.image)
     out_dir = Path(args.out)
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -114,6 +134,7 @@ def cmd_mtf_siemens(args: argparse.Namespace) -> None:
         r_max_frac=args.r_max_frac,
         num_radii=args.radii,
         num_angles=args.angles,
+        bilinear=args.bilinear,
     )
 
     # Save CSV
@@ -125,6 +146,8 @@ def cmd_mtf_siemens(args: argparse.Namespace) -> None:
 
     # Optional plot
     if args.plot:
+        import matplotlib.pyplot as plt
+
         plt.figure()
         plt.plot(freq_norm, mtf_norm, marker="o")
         plt.xlabel("Normalized spatial frequency")
@@ -149,6 +172,8 @@ def cmd_focus_and_mtf(args: argparse.Namespace) -> None:
       2) Siemens-based MTF (multi-radius) at the best-focus frame.
       3) Save all artifacts (CSV/PNG/JSON) into the output folder.
     """
+    from .workflows import run_focus_and_mtf
+
     out_dir = Path(args.out)
     out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -166,6 +191,8 @@ def cmd_focus_and_mtf(args: argparse.Namespace) -> None:
         r_max_frac=args.r_max_frac,
         num_radii=args.radii,
         make_plots=(not args.no_plot),
+        bilinear=args.bilinear,
+        csv_format=args.csv_format,
     )
 
     print("[focus-and-mtf] Done.")
@@ -200,6 +227,12 @@ def cmd_focus_and_mtf_hw(args: argparse.Namespace) -> None:
         out_dir=out_dir,
         dry_run=args.dry_run,
         camera_index=args.camera_index,
+        frame_format=args.frame_format,
+        png_compression=args.png_compression,
+        adaptive=args.adaptive,
+        settle_timeout_s=args.settle_timeout,
+        container=args.container,
+        early_stop=args.early_stop,
     )
 
     print("[focus-and-mtf-hw] Configuration:")
@@ -256,7 +289,10 @@ def build_parser() -> argparse.ArgumentParser:
     p_af.add_argument(
         "--stack",
         required=True,
-        help="Glob pattern for focus stack frames, e.g. 'data/focus_stack/*.png'.",
+        help=(
+            "Glob pattern for focus stack frames, e.g. 'data/focus_stack/*.png', "
+            "or a single stack file (focus_stack.mkv video, or an (N, H, W) .npy)."
+        ),
     )
     p_af.add_argument(
         "--z-start",
@@ -325,6 +361,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_false",
         help="Disable plotting; still writes CSV.",
     )
+    p_mtf.add_argument(
+        "--bilinear",
+        action="store_true",
+        help="Sample MTF circles with bilinear interpolation instead of nearest-neighbor.",
+    )
     p_mtf.set_defaults(func=cmd_mtf_siemens, plot=True)
 
     # -------------------------------------------------------------------------
@@ -337,7 +378,10 @@ def build_parser() -> argparse.ArgumentParser:
     p_fm.add_argument(
         "--stack",
         required=True,
-        help="Glob pattern for focus stack frames, e.g. 'data/focus_stack/*.png'.",
+        help=(
+            "Glob pattern for focus stack frames, e.g. 'data/focus_stack/*.png', "
+            "or a single stack file (focus_stack.mkv video, or an (N, H, W) .npy)."
+        ),
     )
     p_fm.add_argument(
         "--out",
@@ -385,6 +429,17 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Disable PNG plotting (only CSV/JSON).",
     )
+    p_fm.add_argument(
+        "--bilinear",
+        action="store_true",
+        help="Sample MTF circles with bilinear interpolation instead of nearest-neighbor.",
+    )
+    p_fm.add_argument(
+        "--csv-format",
+        choices=("text", "binary"),
+        default="text",
+        help="Curve output format: 'text' CSV (default) or 'binary' .npy arrays.",
+    )
     p_fm.set_defaults(func=cmd_focus_and_mtf)
 
     # -------------------------------------------------------------------------
@@ -466,6 +521,52 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Print the planned sweep but do not move hardware or capture images.",
     )
+    p_hw.add_argument(
+        "--frame-format",
+        choices=["png", "npy"],
+        default="png",
+        help="Captured frame format: 'png' (default) or raw 'npy' (no compression).",
+    )
+    p_hw.add_argument(
+        "--png-compression",
+        type=int,
+        default=None,
+        help="PNG compression level 0-9 for captured frames (1 = fast; default: OpenCV's).",
+    )
+    p_hw.add_argument(
+        "--adaptive",
+        action="store_true",
+        help=(
+            "Adaptive sweep: a coarse pass, a spline fit of the focus metric, "
+            "then a fine pass around its peak (seeded from the last run)."
+        ),
+    )
+    p_hw.add_argument(
+        "--early-stop",
+        action="store_true",
+        help=(
+            "Stop a uniform sweep once the focus metric has clearly passed "
+            "its peak (ignored with --adaptive)."
+        ),
+    )
+    p_hw.add_argument(
+        "--container",
+        choices=["frames", "npy", "h5"],
+        default="frames",
+        help=(
+            "One file per frame (default), or all frames in a single "
+            "frames.npy / frames.h5 (h5 needs h5py)."
+        ),
+    )
+    p_hw.add_argument(
+        "--settle-timeout",
+        type=float,
+        default=None,
+        help=(
+            "Max seconds to wait for the stage to settle after each move "
+            "(default: 0.1 for real stages, 0 for the dummy stage)."
+        ),
+    )
     p_hw.set_defaults(func=cmd_focus_and_mtf_hw)
 
     # GUI commands are intentionally kept out of v1 CLI.
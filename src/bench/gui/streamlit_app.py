@@ -1,14 +1,34 @@
 from __future__ import annotations
+
+# Imported first so BENCH_PARALLEL_FRAMES=1 can pin the inner thread pools
+# before Streamlit pulls in NumPy.
+from bench._threads import limit_inner_threads
+
+limit_inner_threads()
+
 import streamlit as st
 import numpy as np
 import cv2
 from pathlib import Path
-import glob
 
-import matplotlib.pyplot as plt
+from bench.instruments import list_stack_files
 from bench.workflows import run_focus_and_mtf
 
 
+# Streamlit reruns the whole script on every widget interaction. I cache the
+# image decodes keyed by (path, mtime), so unchanged files decode only once
+# and a file rewritten by a new run is picked up automatically.
+
+@st.cache_data(show_spinner=False)
+def _load_gray(path: str, mtime: float) -> np.ndarray | None:
+    """Decode a frame as grayscale (cached; `mtime` is only the cache key)."""
+    return cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+
+
+def _mtime(path: str) -> float:
+    return Path(path).stat().st_mtime
+
+
 def show_image(title: str, img: np.ndarray):
     st.subheader(title)
     if img is None:
@@ -103,7 +123,7 @@ def main():
         # --------------------------------------------------
         st.subheader("Focus stack (defocus sweep)")
 
-        frame_paths = sorted(glob.glob(stack_pattern))
+        frame_paths = list_stack_files(stack_pattern)
         if not frame_paths:
             st.write("⚠ No frames found for pattern:", stack_pattern)
         else:
@@ -114,13 +134,13 @@ def main():
                 cols = st.columns(len(row_paths))
                 for col, fp in zip(cols, row_paths):
                     with col:
-                        img = cv2.imread(fp, cv2.IMREAD_GRAYSCALE)
-                        if img is not None:
-                            st.image(img, use_container_width=True)
-                            st.caption(Path(fp).name)
+                        # The frames are already encoded image files, so I let
+                        # Streamlit serve them as-is (no decode → re-encode).
+                        if Path(fp).is_file():
+                            st.image(fp, use_container_width=True)
                         else:
                             st.write("Failed to load")
-                            st.caption(Path(fp).name)
+                        st.caption(Path(fp).name)
 
         # --------------------------------------------------
         # Autofocus curve
@@ -129,8 +149,8 @@ def main():
             st.subheader("Autofocus curve")
             af_plot_path = summary.get("autofocus_plot")
             if af_plot_path and Path(af_plot_path).is_file():
-                af_img = plt.imread(af_plot_path)
-                st.image(af_img, use_container_width=True)
+                # Served straight from disk: no decode, no PNG re-encode.
+                st.image(str(af_plot_path), use_container_width=True)
             else:
                 st.write("No autofocus plot found.")
 
@@ -140,7 +160,7 @@ def main():
         with col2:
             img_path = summary.get("best_focus_image")
             if img_path and Path(img_path).is_file():
-                img = cv2.imread(img_path, cv2.IMREAD_GRAYSCALE)
+                img = _load_gray(img_path, _mtime(img_path))
                 show_image("Best-focus frame", img)
             else:
                 show_image("Best-focus frame", None)
@@ -152,8 +172,7 @@ def main():
             st.subheader("Siemens MTF (multi-radius)")
             mtf_plot_path = summary.get("mtf_plot")
             if mtf_plot_path and Path(mtf_plot_path).is_file():
-                mtf_img = plt.imread(mtf_plot_path)
-                st.image(mtf_img, use_container_width=True)
+                st.image(str(mtf_plot_path), use_container_width=True)
             else:
                 st.write("No MTF plot found.")
 
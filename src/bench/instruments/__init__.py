@@ -9,14 +9,48 @@ Defines abstract interfaces and mock implementations for:
 For this implementation in here, I have only define Stage and Camera skeletons.
 """
 from .stage import MockStage, Stage
-from .camera import Camera, MockCameraFocusStack
-from .stage_kinesis import ThorlabsKMTS50Stage
+from .camera import (
+    Camera,
+    MemmapCameraFocusStack,
+    MockCameraFocusStack,
+    list_stack_files,
+    open_focus_stack,
+    read_image_shape,
+)
+
+# Vendor-backed stages are resolved on first attribute access (PEP 562), so
+# importing this package (e.g. on every Streamlit rerun) never touches their
+# SDKs. `from bench.instruments import ThorlabsKMTS50Stage` still works.
+_LAZY_EXPORTS = {
+    "ThorlabsKMTS50Stage": ".stage_kinesis",
+    "VisaStage": ".visa_stage",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # cache: later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
 
 __all__ = [
     "Camera",
     "Stage",
     "MockCameraFocusStack",
+    "MemmapCameraFocusStack",
     "MockStage",
     "ThorlabsKMTS50Stage",
+    "list_stack_files",
+    "open_focus_stack",
+    "read_image_shape",
 ]
\ No newline at end of file
@@ -12,14 +12,94 @@ same interface (e.g., PySpin, UVC/OpenCV, custom board camera SDK).
 
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Sequence, Tuple
+import fnmatch
+import io
+import os
+import struct
 
 import cv2
 import numpy as np
 import glob
 
 
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Single-file focus stacks (e.g. `make_focus_stack.py --container video`).
+_VIDEO_SUFFIXES = {".mkv", ".avi", ".mp4"}
+
+
+def read_image_shape(path: str | Path) -> Tuple[int, int]:
+    """
+    Return the (height, width) of a grayscale frame without decoding pixels.
+
+    PNG sizes come straight from the IHDR chunk and `.npy` sizes from the
+    array header; anything else falls back to a full grayscale decode.
+    """
+    path = Path(path)
+
+    if path.suffix == ".npy":
+        shape = np.load(path, mmap_mode="r").shape
+        return int(shape[0]), int(shape[1])
+
+    with path.open("rb") as f:
+        head = f.read(24)
+    if head[:8] == _PNG_SIGNATURE and head[12:16] == b"IHDR":
+        width, height = struct.unpack(">II", head[16:24])
+        return int(height), int(width)
+
+    img = cv2.imread(str(path), cv2.IMREAD_GRAYSCALE)
+    if img is None:
+        raise RuntimeError(f"Failed to read image: {path}")
+    return int(img.shape[0]), int(img.shape[1])
+
+
+@lru_cache(maxsize=8)
+def _sorted_glob(pattern: str, dir_mtime_ns: int) -> Tuple[str, ...]:
+    """
+    Sorted matches of a single-directory pattern, cached per directory mtime.
+
+    One os.scandir pass over the parent directory with fnmatch on each entry
+    name (glob's rules: hidden files only match a pattern that starts with a
+    dot). All matches share the directory prefix, so sorting the names sorts
+    the paths.
+    """
+    dirname, name_pattern = os.path.split(pattern)
+    show_hidden = name_pattern.startswith(".")
+    with os.scandir(dirname or ".") as it:
+        names = sorted(
+            entry.name
+            for entry in it
+            if (show_hidden or not entry.name.startswith("."))
+            and fnmatch.fnmatch(entry.name, name_pattern)
+        )
+    return tuple(os.path.join(dirname, n) for n in names)
+
+
+def list_stack_files(pattern: str) -> List[str]:
+    """
+    Return the sorted files matching a focus-stack glob pattern.
+
+    The camera and the GUI thumbnail grid both need this list, and the GUI
+    asks again on every rerun. I cache it keyed by the pattern's directory
+    mtime, which changes whenever a file is added, removed or renamed, so
+    the cache can never serve a stale listing. Patterns whose directory part
+    itself contains wildcards are globbed without caching.
+    """
+    dirname = os.path.dirname(pattern)
+    if glob.has_magic(dirname):
+        return sorted(glob.glob(pattern))
+    try:
+        dir_mtime_ns = os.stat(dirname or ".").st_mtime_ns
+    except OSError:
+        return []
+    return list(_sorted_glob(pattern, dir_mtime_ns))
+
+
 class Camera:
     """
     Abstract camera interface.
@@ -43,21 +123,77 @@ class MockCameraFocusStack(Camera):
       - set_index(i) selects which "frame" the camera will return
       - grab() always returns the image for the current index
 
+    Frames can be any image format OpenCV reads, or raw `.npy` arrays.
+    Instead of a glob pattern I also accept a single video file (e.g. the
+    lossless FFV1 `focus_stack.mkv`), where each video frame is one stack frame,
+    or an already ordered sequence of frame paths (e.g. the result of
+    `list_stack_files`), which I use as-is without globbing or re-sorting.
+
+    With `cache=True` I read every file's *encoded* bytes into memory once
+    and decode on demand with cv2.imdecode. Repeated sweeps over the same
+    stack (e.g. GUI reruns) then never touch the disk again, while RAM stays
+    at the compressed size rather than the decoded size. Video stacks are
+    not cached.
+
     This lets me test autofocus and Siemens/MTF logic end-to-end without
     touching hardware.
     """
 
-    def __init__(self, pattern: str) -> None:
-        files: List[str] = sorted(glob.glob(pattern))
+    def __init__(
+        self, pattern: str | Sequence[str | Path], cache: bool = False
+    ) -> None:
+        self._idx = 0
+        self._video: Path | None = None
+        self._cap: cv2.VideoCapture | None = None
+        self._encoded: List[np.ndarray] | None = None
+
+        if not isinstance(pattern, (str, os.PathLike)):
+            # Caller already listed (and ordered) the frames.
+            self._init_files(list(pattern), "<file list>", cache)
+            return
+
+        video = Path(pattern)
+        if video.suffix.lower() in _VIDEO_SUFFIXES and video.is_file():
+            self._video = video
+            self._files: List[Path] = []
+            cap = self._capture()
+            self._num_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            self._shape = (
+                int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            )
+            if self._num_frames <= 0:
+                raise FileNotFoundError(f"No frames found in video: {pattern}")
+            return
+
+        self._init_files(list_stack_files(str(pattern)), pattern, cache)
+
+    def _init_files(
+        self, files: List[str | Path], pattern: str | Path, cache: bool
+    ) -> None:
         if not files:
             raise FileNotFoundError(f"No images matched pattern: {pattern}")
         self._files = [Path(f) for f in files]
-        self._idx = 0
+        self._num_frames = len(self._files)
+        self._shape = None
+
+        if cache:
+            self._encoded = [np.fromfile(f, dtype=np.uint8) for f in self._files]
 
     @property
     def num_frames(self) -> int:
         """Number of frames in the focus stack."""
-        return len(self._files)
+        return self._num_frames
+
+    @property
+    def frame_shape(self) -> Tuple[int, int]:
+        """
+        (height, width) of the stack frames, read from the first file's
+        header (or the video stream properties) so no pixels are decoded.
+        """
+        if self._shape is None:
+            self._shape = read_image_shape(self._files[0])
+        return self._shape
 
     def set_index(self, idx: int) -> None:
         """
@@ -73,6 +209,136 @@ class MockCameraFocusStack(Camera):
         """Return the currently selected frame index."""
         return self._idx
 
+    def _capture(self) -> cv2.VideoCapture:
+        """Open the backing video once and keep the capture for later reads."""
+        if self._cap is None:
+            cap = cv2.VideoCapture(str(self._video))
+            if not cap.isOpened():
+                raise RuntimeError(f"Failed to open video: {self._video}")
+            self._cap = cap
+        return self._cap
+
+    def _read_video_frame(self) -> np.ndarray:
+        """Decode the next frame from the video capture as grayscale."""
+        ok, frame = self._capture().read()
+        if not ok or frame is None:
+            raise RuntimeError(f"Failed to read frame from video: {self._video}")
+        if frame.ndim == 3:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        return frame
+
+    def _read(self, path: Path) -> np.ndarray:
+        if path.suffix == ".npy":
+            # Raw stacks written with `make_focus_stack.py --fast-io`.
+            return np.load(path)
+        img = cv2.imread(str(path), cv2.IMREAD_GRAYSCALE)
+        if img is None:
+            raise RuntimeError(f"Failed to read image: {path}")
+        return img
+
+    def _read_frame(self, idx: int) -> np.ndarray:
+        """Decode frame `idx` from the in-memory cache, or from disk."""
+        if self._encoded is None:
+            return self._read(self._files[idx])
+
+        path = self._files[idx]
+        buf = self._encoded[idx]
+        if path.suffix == ".npy":
+            return np.load(io.BytesIO(buf))
+        img = cv2.imdecode(buf, cv2.IMREAD_GRAYSCALE)
+        if img is None:
+            raise RuntimeError(f"Failed to decode cached image: {path}")
+        return img
+
+    def prefetch(self, n_workers: int = 4) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Yield (index, frame) pairs in stack order while decoding ahead.
+
+        cv2.imread releases the GIL, so a small thread pool decodes the next
+        few frames while the caller is still processing the current one. At
+        most `n_workers` frames are in flight, so memory stays bounded.
+
+        Video stacks are decoded sequentially (a capture cannot be shared
+        between threads), so for them this is a plain in-order iterator.
+        """
+        if self._video is not None:
+            self._capture().set(cv2.CAP_PROP_POS_FRAMES, 0)
+            for i in range(self.num_frames):
+                yield i, self._read_video_frame()
+            return
+
+        n_workers = max(1, n_workers)
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            pending: deque = deque()
+            for i in range(self.num_frames):
+                pending.append((i, pool.submit(self._read_frame, i)))
+                if len(pending) > n_workers:
+                    idx, future = pending.popleft()
+                    yield idx, future.result()
+            while pending:
+                idx, future = pending.popleft()
+                yield idx, future.result()
+
+    def load_all(self, n_workers: int | None = None) -> np.ndarray:
+        """
+        Decode the whole focus stack once into a single (n, H, W) array.
+
+        The stack is small and fixed on disk, so for full sweeps I pay the
+        PNG decode cost once and then iterate over contiguous slices.
+        Frames are decoded through `prefetch(n_workers)`, so several files
+        decode in parallel; by default I use one worker per core (capped at
+        the number of frames). All frames must share the same shape and
+        dtype. The dtype is taken from the first frame: uint8 for images,
+        but raw `.npy` frames (e.g. from a 16-bit camera) keep their own.
+        """
+        if n_workers is None:
+            n_workers = min(os.cpu_count() or 1, self.num_frames)
+        shape = self.frame_shape
+        stack: np.ndarray | None = None
+
+        for i, img in self.prefetch(n_workers):
+            if stack is None:
+                stack = np.empty((self.num_frames,) + shape, dtype=img.dtype)
+            self._check_frame(i, img, shape, stack.dtype)
+            stack[i] = img
+
+        return stack
+
+    def _check_frame(
+        self, i: int, img: np.ndarray, shape: Tuple[int, int], dtype: np.dtype
+    ) -> None:
+        """Raise if frame `i` does not match the stack's shape and dtype."""
+        if img.shape != shape or img.dtype != dtype:
+            source = self._video if self._video is not None else self._files[i]
+            raise ValueError(
+                f"Frame {source} has shape {img.shape} and dtype {img.dtype}, "
+                f"expected {shape} and {dtype}."
+            )
+
+    def materialize_npy(self, out_path: str | Path) -> Path:
+        """
+        Decode the stack once and write it as a single (N, H, W) `.npy`.
+
+        Open the result with `MemmapCameraFocusStack` (or pass its path as
+        the stack pattern) and later sweeps skip PNG decoding entirely.
+        As in `load_all`, the dtype follows the first frame.
+        """
+        out_path = Path(out_path)
+        shape = (self.num_frames,) + self.frame_shape
+        mm: np.ndarray | None = None
+        try:
+            for i, img in self.prefetch():
+                if mm is None:
+                    mm = np.lib.format.open_memmap(
+                        out_path, mode="w+", dtype=img.dtype, shape=shape
+                    )
+                self._check_frame(i, img, shape[1:], mm.dtype)
+                mm[i] = img
+            mm.flush()
+        finally:
+            del mm
+        return out_path
+
     def grab(self) -> np.ndarray:
         """
         Return the current frame as a grayscale image.
@@ -81,8 +347,73 @@ class MockCameraFocusStack(Camera):
         across simulated and real cameras. Later, if I need Bayer or RGB
         handling, this is the place to extend it.
         """
-        path = self._files[self._idx]
-        img = cv2.imread(str(path), cv2.IMREAD_GRAYSCALE)
-        if img is None:
-            raise RuntimeError(f"Failed to read image: {path}")
-        return img
+        if self._video is not None:
+            self._capture().set(cv2.CAP_PROP_POS_FRAMES, self._idx)
+            return self._read_video_frame()
+        return self._read_frame(self._idx)
+
+
+class MemmapCameraFocusStack(Camera):
+    """
+    Focus-stack camera backed by one memory-mapped (N, H, W) `.npy` file.
+
+    This is the fast path for stacks I sweep over and over: the file comes
+    from `MockCameraFocusStack.materialize_npy()`, pages in on demand, and
+    grab() returns a read-only view into the map — no decode, no copy.
+
+    It mirrors MockCameraFocusStack's interface (set_index, grab, load_all,
+    num_frames, frame_shape), so autofocus code can use either.
+    """
+
+    def __init__(self, npy_path: str | Path) -> None:
+        self._path = Path(npy_path)
+        self._mm = np.load(self._path, mmap_mode="r")
+        if self._mm.ndim != 3:
+            raise ValueError(
+                f"Expected an (N, H, W) stack in {self._path}, got shape {self._mm.shape}."
+            )
+        if self._mm.shape[0] == 0:
+            raise FileNotFoundError(f"Focus stack is empty: {self._path}")
+        self._idx = 0
+
+    @property
+    def num_frames(self) -> int:
+        """Number of frames in the focus stack."""
+        return int(self._mm.shape[0])
+
+    @property
+    def frame_shape(self) -> Tuple[int, int]:
+        """(height, width) of the stack frames."""
+        return int(self._mm.shape[1]), int(self._mm.shape[2])
+
+    def set_index(self, idx: int) -> None:
+        """Select the current frame, clamped to [0, num_frames-1]."""
+        self._idx = max(0, min(idx, self.num_frames - 1))
+
+    def current_index(self) -> int:
+        """Return the currently selected frame index."""
+        return self._idx
+
+    def load_all(self, n_workers: int | None = None) -> np.ndarray:
+        """Return the whole (N, H, W) stack as the memory map itself."""
+        return self._mm
+
+    def grab(self) -> np.ndarray:
+        """Return the current frame as a read-only view into the memmap."""
+        return self._mm[self._idx]
+
+
+def open_focus_stack(
+    pattern: str | Sequence[str | Path],
+) -> "MockCameraFocusStack | MemmapCameraFocusStack":
+    """
+    Open a focus stack from a glob pattern, a stack video, a single
+    (N, H, W) `.npy` file (memory-mapped), or an ordered list of frame paths.
+    """
+    if not isinstance(pattern, (str, os.PathLike)):
+        return MockCameraFocusStack(pattern)
+    path = Path(pattern)
+    if path.suffix == ".npy" and path.is_file():
+        if len(np.load(path, mmap_mode="r").shape) == 3:
+            return MemmapCameraFocusStack(path)
+    return MockCameraFocusStack(pattern)
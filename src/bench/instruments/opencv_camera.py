@@ -20,9 +20,17 @@ class OpenCVCamera(Camera):
     I will wrap those behind this same Camera interface later.
     """
 
-    def __init__(self, device_index: int = 0):
+    def __init__(self, device_index: int = 0, raw_gray: bool = False):
         self.device_index = device_index
         self.cap: cv2.VideoCapture | None = None
+        # Reused BGR decode target, so read() does not allocate per frame.
+        self._bgr_buf: np.ndarray | None = None
+        # Opt-in: ask for MJPG without OpenCV's BGR conversion and decode
+        # straight to gray (see `_raw_to_gray`). Off by default because the
+        # raw layout depends on the capture backend.
+        self.raw_gray = raw_gray
+        self._raw_active = False
+        self._width = 0
 
     def open(self) -> None:
         """
@@ -39,6 +47,18 @@ class OpenCVCamera(Camera):
                 f"OpenCVCamera: could not open camera at index {self.device_index}"
             )
 
+        if self.raw_gray:
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+            self.cap.set(cv2.CAP_PROP_CONVERT_RGB, 0)
+            # Backends that ignore the request keep delivering BGR frames.
+            self._raw_active = self.cap.get(cv2.CAP_PROP_CONVERT_RGB) == 0
+
+        w = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        h = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self._width = w
+        use_buf = w > 0 and h > 0 and not self._raw_active
+        self._bgr_buf = np.empty((h, w, 3), dtype=np.uint8) if use_buf else None
+
     def close(self) -> None:
         """
         Release the underlying device.
@@ -48,23 +68,67 @@ class OpenCVCamera(Camera):
             self.cap.release()
             self.cap = None
 
-    def grab(self) -> np.ndarray:
+    def grab(self, dst: np.ndarray | None = None) -> np.ndarray:
         """
         Grab a single frame from the camera as a grayscale uint8 image.
 
         I convert color frames to grayscale for consistency with the
         rest of the MTF/autofocus pipeline.
+
+        The color frame is decoded into a buffer I keep between calls. If
+        `dst` is given (uint8, (H, W)), the grayscale result is written into
+        it and `dst` is returned, so a sweep can grab with zero per-frame
+        allocations. Without `dst` I return a fresh array, so frames the
+        caller keeps are never overwritten by the next grab.
         """
         if self.cap is None:
             raise RuntimeError("OpenCVCamera.grab() called before open().")
 
-        ok, frame = self.cap.read()
+        if self._raw_active:
+            ok, frame = self.cap.read()
+            if not ok or frame is None:
+                raise RuntimeError("OpenCVCamera: failed to grab frame from camera.")
+            gray = self._raw_to_gray(frame)
+            if dst is None:
+                return gray
+            np.copyto(dst, gray)
+            return dst
+
+        ok, frame = self.cap.read(self._bgr_buf)
         if not ok or frame is None:
             raise RuntimeError("OpenCVCamera: failed to grab frame from camera.")
+        # If the device changed resolution, OpenCV allocated a new frame;
+        # keep that one as the buffer from now on.
+        self._bgr_buf = frame
 
         if frame.ndim == 3:
-            frame_gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        else:
-            frame_gray = frame
+            return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=dst)
+
+        if dst is None:
+            # The raw buffer is reused by the next read, so hand out a copy.
+            return frame.copy()
+        np.copyto(dst, frame)
+        return dst
 
-        return frame_gray
+    def _raw_to_gray(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Turn an unconverted capture frame into grayscale without a BGR pass.
+
+        - MJPG arrives as one row (or a flat array) of JPEG bytes: I decode
+          it directly with IMREAD_GRAYSCALE, which skips chroma entirely.
+        - Packed YUYV arrives as (H, W, 2) or (H, 2W): luma is every other
+          byte, so gray is just a strided view of the Y samples.
+        - Anything else goes through the usual BGR→gray conversion.
+        """
+        if frame.ndim == 1 or (frame.ndim == 2 and frame.shape[0] == 1):
+            gray = cv2.imdecode(frame.reshape(-1), cv2.IMREAD_GRAYSCALE)
+            if gray is None:
+                raise RuntimeError("OpenCVCamera: failed to decode MJPG frame.")
+            return gray
+        if frame.ndim == 3 and frame.shape[2] == 2:
+            return np.ascontiguousarray(frame[:, :, 0])
+        if frame.ndim == 2 and self._width > 0 and frame.shape[1] == 2 * self._width:
+            return np.ascontiguousarray(frame[:, ::2])
+        if frame.ndim == 3:
+            return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        return frame
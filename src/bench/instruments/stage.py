@@ -12,6 +12,9 @@ class Stage:
       - move_to(pos_um): absolute move in micrometers
       - step(dz_um): relative move in micrometers
       - position(): current position in micrometers
+
+    Stages may also provide is_settled() -> bool, which the hardware
+    workflow polls after a move instead of sleeping a fixed time.
     """
 
     def move_to(self, pos_um: float) -> None:  # pragma: no cover - interface
@@ -44,3 +47,7 @@ class MockStage(Stage):
 
     def position(self) -> float:
         return self._z
+
+    def is_settled(self) -> bool:
+        # In-memory moves finish instantly.
+        return True
@@ -2,7 +2,8 @@
 Focus, contrast, and Siemens-based MTF metrics.
 
 Exposes:
-- Generic focus metrics (Tenengrad, Laplacian variance)
+- Generic focus metrics (Tenengrad, thresholded Sobel Tenengrad, integer
+  Tenengrad for uint8 ranking, Laplacian variance)
 - Siemens-specific focus metric (Tenengrad in Siemens annulus)
 - Siemens-based MTF (multi-radius curve)
 - Siemens-based FFT spectrum (single-radius, debug/inspection)
@@ -10,9 +11,14 @@ Exposes:
 
 from .contrast import (
     tenengrad,
+    tenengrad_sobel,
+    tenengrad_u8,
     laplacian_variance,
     tenengrad_in_mask,
+    siemens_focus_mask,
     siemens_focus_metric,
+    siemens_focus_metric_stack,
+    GradientWorkspace,
 )
 
 from .mtf_siemens import (
@@ -23,9 +29,14 @@ from .mtf_siemens import (
 __all__ = [
     # Focus metrics
     "tenengrad",
+    "tenengrad_sobel",
+    "tenengrad_u8",
     "laplacian_variance",
     "tenengrad_in_mask",
+    "siemens_focus_mask",
     "siemens_focus_metric",
+    "siemens_focus_metric_stack",
+    "GradientWorkspace",
 
     # Siemens MTF
     "mtf_siemens_spectrum_single_radius",
@@ -4,7 +4,9 @@ Focus and contrast metrics used throughout the Camera MTF Bench.
 I keep this module intentionally lightweight:
     - A small grayscale helper so every metric starts from a clean 2D float image.
     - Two general-purpose focus metrics (Tenengrad and Laplacian variance).
-    - A Siemens-specific metric that computes Tenengrad inside an annulus.
+    - A thresholded Sobel Tenengrad, JIT-compiled with Numba when available.
+    - A Siemens-specific metric that computes Tenengrad inside an annulus
+      (a fused Numba kernel when available, OpenCV otherwise).
 
 Later, if I add other metrics metrics such as frequency-domain sharpness scores,
 I will slot them into this module behind the same simple interface.
@@ -12,23 +14,24 @@ I will slot them into this module behind the same simple interface.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple
+
 import numpy as np
 import cv2
 
-from bench.targets import estimate_center_and_radius, make_annulus_mask
+from bench._numba import HAVE_NUMBA, njit, prange
+from bench.targets import SiemensParams, estimate_center_and_radius, make_annulus_mask
 
 
 # ---------------------------------------------------------------------------
 # Shared grayscale helper
 # ---------------------------------------------------------------------------
 
-def _to_float_gray(image: np.ndarray) -> np.ndarray:
+def _to_gray(image: np.ndarray) -> np.ndarray:
     """
-    Convert an image to a 2D float64 grayscale array.
-
-    I normalize everything to a simple grayscale float representation so
-    that all metrics behave consistently regardless of whether frames come
-    from OpenCV cameras, simulated stacks, PNGs, or raw Bayer data.
+    Convert an image to a 2D grayscale array, keeping its dtype.
 
     Parameters
     ----------
@@ -38,21 +41,96 @@ def _to_float_gray(image: np.ndarray) -> np.ndarray:
     Returns
     -------
     np.ndarray
-        2D float64 grayscale image.
+        2D grayscale image (uint8 for color input).
     """
     arr = np.asarray(image)
 
     if arr.ndim == 2:
-        gray = arr
-    elif arr.ndim == 3 and arr.shape[2] in (3, 4):
+        return arr
+    if arr.ndim == 3 and arr.shape[2] in (3, 4):
         # Convert using OpenCV’s BGR→gray. I cast to uint8 if needed.
         if arr.dtype != np.uint8:
             arr = arr.astype(np.uint8)
-        gray = cv2.cvtColor(arr, cv2.COLOR_BGR2GRAY)
-    else:
-        raise ValueError(f"Unsupported image shape for grayscale conversion: {arr.shape}")
+        return cv2.cvtColor(arr, cv2.COLOR_BGR2GRAY)
 
-    return gray.astype(np.float64)
+    raise ValueError(f"Unsupported image shape for grayscale conversion: {arr.shape}")
+
+
+# ---------------------------------------------------------------------------
+# Reusable gradient buffers (zero allocations per frame in sweep loops)
+# ---------------------------------------------------------------------------
+
+@dataclass
+class GradientWorkspace:
+    """
+    Preallocated float32 buffers for gradient-energy metrics.
+
+    In autofocus loops I evaluate the same-sized frame dozens of times. Passing
+    one workspace into the metric lets me reuse these (H, W) buffers instead of
+    allocating fresh gray/gx/gy/g² arrays for every frame.
+
+    Attributes
+    ----------
+    gray, gx, gy, g2 : np.ndarray
+        float32 arrays of identical (H, W) shape.
+    """
+    gray: np.ndarray
+    gx: np.ndarray
+    gy: np.ndarray
+    g2: np.ndarray
+
+    @classmethod
+    def for_shape(cls, shape: Tuple[int, int]) -> "GradientWorkspace":
+        """Allocate a workspace for frames of the given (H, W) shape."""
+        gray = np.empty(shape, dtype=np.float32)
+        return cls(
+            gray=gray,
+            gx=np.empty_like(gray),
+            gy=np.empty_like(gray),
+            g2=np.empty_like(gray),
+        )
+
+
+# Source depths cv2.Sobel / cv2.Laplacian read directly into a CV_32F destination.
+_CV_INPUT_DTYPES = (np.uint8, np.uint16, np.int16, np.float32)
+
+
+def _sobel_energy(
+    gray: np.ndarray,
+    workspace: GradientWorkspace | None = None,
+) -> np.ndarray:
+    """
+    Return the float32 Sobel gradient energy gx² + gy² of a 2D image.
+
+    Gradients are 3x3 Sobel (cv2.Sobel, CV_32F, default reflect-101 border).
+    uint8 frames go straight into OpenCV; other dtypes are cast to float32
+    first. With a workspace, every intermediate lands in its buffers and the
+    returned array is `workspace.g2`.
+    """
+    if workspace is None:
+        if gray.dtype not in _CV_INPUT_DTYPES:
+            gray = gray.astype(np.float32)
+        gx = cv2.Sobel(gray, cv2.CV_32F, 1, 0, ksize=3)
+        gy = cv2.Sobel(gray, cv2.CV_32F, 0, 1, ksize=3)
+        cv2.multiply(gx, gx, dst=gx)
+        cv2.multiply(gy, gy, dst=gy)
+        return cv2.add(gx, gy, dst=gx)
+
+    ws = workspace
+    if gray.shape != ws.g2.shape:
+        raise ValueError(
+            f"Workspace shape {ws.g2.shape} does not match image shape {gray.shape}."
+        )
+    if gray.dtype not in _CV_INPUT_DTYPES:
+        np.copyto(ws.gray, gray, casting="unsafe")
+        gray = ws.gray
+
+    cv2.Sobel(gray, cv2.CV_32F, 1, 0, dst=ws.gx, ksize=3)
+    cv2.Sobel(gray, cv2.CV_32F, 0, 1, dst=ws.gy, ksize=3)
+    cv2.multiply(ws.gx, ws.gx, dst=ws.g2)
+    cv2.multiply(ws.gy, ws.gy, dst=ws.gy)
+    cv2.add(ws.g2, ws.gy, dst=ws.g2)
+    return ws.g2
 
 
 # ---------------------------------------------------------------------------
@@ -64,8 +142,8 @@ def tenengrad(image: np.ndarray) -> float:
     Tenengrad focus metric (global gradient energy).
 
     Steps I use:
-        1) Convert to float64 grayscale.
-        2) Compute gx = dI/dx and gy = dI/dy using numpy gradients.
+        1) Convert to grayscale.
+        2) Compute gx and gy with 3x3 Sobel filters (float32, OpenCV SIMD).
         3) Compute gradient energy = gx² + gy².
         4) Return the mean energy.
 
@@ -76,13 +154,120 @@ def tenengrad(image: np.ndarray) -> float:
     float
         Tenengrad sharpness metric.
     """
-    gray = _to_float_gray(image)
+    return _tenengrad_from_gray(_to_gray(image))
+
+
+def _tenengrad_from_gray(
+    gray: np.ndarray,
+    workspace: GradientWorkspace | None = None,
+) -> float:
+    """Tenengrad on an already-2D grayscale image (no conversion)."""
+    return float(cv2.mean(_sobel_energy(gray, workspace))[0])
+
+
+def tenengrad_u8(gray_u8: np.ndarray) -> int:
+    """
+    Integer-domain Tenengrad for 8-bit frames: the *sum* of Sobel gx² + gy².
+
+    For pure focus ranking only the argmax matters, so I skip every float
+    conversion: 16-bit Sobel gradients, 32-bit squares (exact, since
+    |gx|, |gy| ≤ 1020 for uint8 input) and one cv2.sumElems reduction, all on
+    OpenCV's integer SIMD paths.
+
+    Dividing by the pixel count gives exactly `tenengrad(gray_u8)`.
+
+    Parameters
+    ----------
+    gray_u8 : np.ndarray
+        2D uint8 grayscale image.
+
+    Returns
+    -------
+    int
+        Total gradient energy.
+    """
+    if gray_u8.dtype != np.uint8 or gray_u8.ndim != 2:
+        raise ValueError("tenengrad_u8 expects a 2D uint8 grayscale image.")
+
+    gx = cv2.Sobel(gray_u8, cv2.CV_16S, 1, 0, ksize=3)
+    gy = cv2.Sobel(gray_u8, cv2.CV_16S, 0, 1, ksize=3)
+    energy = cv2.add(
+        cv2.multiply(gx, gx, dtype=cv2.CV_32S),
+        cv2.multiply(gy, gy, dtype=cv2.CV_32S),
+    )
+    return int(cv2.sumElems(energy)[0])
+
+
+# ---------------------------------------------------------------------------
+# 1b) Thresholded Sobel Tenengrad (fused single pass with Numba)
+# ---------------------------------------------------------------------------
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _sobel_energy_sum_jit(gray, t2):
+    """Sum of Sobel gradient energy above t2 over interior pixels (one pass)."""
+    h, w = gray.shape
+    total = 0.0
+    for y in prange(1, h - 1):
+        row = 0.0
+        for x in range(1, w - 1):
+            a = float(gray[y - 1, x - 1])
+            b = float(gray[y - 1, x])
+            c = float(gray[y - 1, x + 1])
+            d = float(gray[y, x - 1])
+            f = float(gray[y, x + 1])
+            g = float(gray[y + 1, x - 1])
+            hh = float(gray[y + 1, x])
+            i = float(gray[y + 1, x + 1])
+            gx = (c + 2.0 * f + i) - (a + 2.0 * d + g)
+            gy = (g + 2.0 * hh + i) - (a + 2.0 * b + c)
+            g2 = gx * gx + gy * gy
+            if g2 > t2:
+                row += g2
+        total += row
+    return total
+
+
+def tenengrad_sobel(image: np.ndarray, threshold: float = 0.0) -> float:
+    """
+    Classic thresholded Tenengrad focus metric.
 
-    gx = np.gradient(gray, axis=1)
-    gy = np.gradient(gray, axis=0)
+    This is the textbook form: 3x3 Sobel gradients, squared magnitude, and
+    only contributions above `threshold**2` are accumulated. I return the
+    mean over interior pixels (the one-pixel border is skipped, so no border
+    mode is involved).
 
+    With Numba installed, Sobel + square + threshold + sum run as one fused
+    pass over the pixels; otherwise I fall back to cv2.Sobel.
+
+    Parameters
+    ----------
+    image : np.ndarray
+        Input image (grayscale or BGR).
+    threshold : float
+        Gradient-magnitude threshold T; pixels with gx² + gy² <= T² are ignored.
+
+    Returns
+    -------
+    float
+        Thresholded Tenengrad sharpness metric.
+    """
+    gray = _to_gray(image)
+    h, w = gray.shape
+    if h < 3 or w < 3:
+        return 0.0
+
+    t2 = float(threshold) ** 2
+    n_interior = (h - 2) * (w - 2)
+
+    if HAVE_NUMBA:
+        return float(_sobel_energy_sum_jit(np.ascontiguousarray(gray), t2)) / n_interior
+
+    gx = cv2.Sobel(gray, cv2.CV_32F, 1, 0, ksize=3)[1:-1, 1:-1]
+    gy = cv2.Sobel(gray, cv2.CV_32F, 0, 1, ksize=3)[1:-1, 1:-1]
     g2 = gx * gx + gy * gy
-    return float(g2.mean())
+    if t2 > 0:
+        g2[g2 <= t2] = 0.0
+    return float(g2.sum(dtype=np.float64)) / n_interior
 
 
 # ---------------------------------------------------------------------------
@@ -104,18 +289,28 @@ def laplacian_variance(image: np.ndarray) -> float:
     float
         Variance of Laplacian.
     """
-    gray = _to_float_gray(image)
-    lap = cv2.Laplacian(gray, ddepth=cv2.CV_64F)
-    return float(lap.var())
+    gray = _to_gray(image)
+    if gray.dtype not in _CV_INPUT_DTYPES:
+        gray = gray.astype(np.float32)
+
+    # uint8 frames go straight into OpenCV with a float32 destination, and
+    # meanStdDev gets the variance in one SIMD pass (double accumulators).
+    lap = cv2.Laplacian(gray, ddepth=cv2.CV_32F)
+    _, std = cv2.meanStdDev(lap)
+    return float(std[0, 0]) ** 2
 
 
 # ---------------------------------------------------------------------------
 # 3) Tenengrad inside a mask (annulus-aware focus metric)
 # ---------------------------------------------------------------------------
 
-def tenengrad_in_mask(image: np.ndarray, mask: np.ndarray) -> float:
+def tenengrad_in_mask(
+    image: np.ndarray,
+    mask: np.ndarray,
+    workspace: GradientWorkspace | None = None,
+) -> float:
     """
-    Tenengrad focus metric restricted to a boolean mask.
+    Tenengrad focus metric restricted to a mask.
 
     I use this when I only want to measure sharpness in a specific region
     (like the active Siemens spokes), rather than over the whole frame.
@@ -124,40 +319,239 @@ def tenengrad_in_mask(image: np.ndarray, mask: np.ndarray) -> float:
     ----------
     image : np.ndarray
         Input image.
-    mask : np.ndarray of bool
-        Must match the grayscale image size.
+    mask : np.ndarray of uint8 (or bool)
+        Nonzero pixels are measured; must match the grayscale image size.
+        uint8 is what OpenCV's masked reductions take, so I prefer it; a
+        bool mask is reinterpreted as uint8 without a copy.
+    workspace : GradientWorkspace, optional
+        Preallocated float32 buffers (see `GradientWorkspace.for_shape`).
+        When given, no per-call image-sized arrays are allocated.
 
     Returns
     -------
     float
         Masked gradient energy. Returns 0.0 if mask is empty.
     """
-    gray = _to_float_gray(image)
+    return _tenengrad_in_mask_from_gray(_to_gray(image), mask, workspace)
 
-    gx = np.gradient(gray, axis=1)
-    gy = np.gradient(gray, axis=0)
-    g2 = gx * gx + gy * gy
 
-    if mask.shape != g2.shape:
+def _as_mask_u8(mask: np.ndarray) -> np.ndarray:
+    """uint8 view of a bool mask (no copy); other dtypes are cast once."""
+    if mask.dtype == np.uint8:
+        return mask
+    if mask.dtype == bool:
+        return mask.view(np.uint8)
+    return (mask != 0).view(np.uint8)
+
+
+def _mask_bbox(
+    mask_u8: np.ndarray,
+) -> Tuple[Tuple[slice, slice], Tuple[slice, slice], Tuple[slice, slice]]:
+    """
+    Bounding box of a mask, grown by the 1-pixel Sobel support.
+
+    Returns (outer, inner, box) slice pairs: `outer` is the crop I filter
+    (the box plus a one-pixel margin, clamped to the image), `inner` selects
+    the box inside that crop, and `box` selects it in the full image.
+
+    Every box pixel then sees its true neighbours, and wherever the box
+    touches the image edge the crop edge *is* the image edge, so Sobel on the
+    crop gives exactly the full-image values inside the box.
+    """
+    h, w = mask_u8.shape
+    x, y, bw, bh = cv2.boundingRect(mask_u8)
+    y0, y1 = max(y - 1, 0), min(y + bh + 1, h)
+    x0, x1 = max(x - 1, 0), min(x + bw + 1, w)
+    outer = (slice(y0, y1), slice(x0, x1))
+    inner = (slice(y - y0, y - y0 + bh), slice(x - x0, x - x0 + bw))
+    box = (slice(y, y + bh), slice(x, x + bw))
+    return outer, inner, box
+
+
+@njit(fastmath=True, cache=True)
+def _masked_sobel_energy_row(gray, mask, y, x0, x1):
+    """
+    Sum of Sobel gx² + gy² over the mask pixels of row y in [x0:x1].
+
+    Borders follow cv2.Sobel (reflect-101). `gray` must be uint8: the
+    arithmetic is exact int32 (|g|² ≤ 2·1020²).
+    """
+    h, w = gray.shape
+    r0 = gray[y - 1 if y > 0 else 1]
+    r1 = gray[y]
+    r2 = gray[y + 1 if y < h - 1 else h - 2]
+    mrow = mask[y]
+    row = 0
+    for x in range(x0, x1):
+        if mrow[x]:
+            xm = x - 1 if x > 0 else 1
+            xp = x + 1 if x < w - 1 else w - 2
+            a = np.int32(r0[xm])
+            b = np.int32(r0[x])
+            c = np.int32(r0[xp])
+            d = np.int32(r1[xm])
+            f = np.int32(r1[xp])
+            g = np.int32(r2[xm])
+            hh = np.int32(r2[x])
+            i = np.int32(r2[xp])
+            gx = (c + 2 * f + i) - (a + 2 * d + g)
+            gy = (g + 2 * hh + i) - (a + 2 * b + c)
+            row += gx * gx + gy * gy
+    return row
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _masked_sobel_energy_sum_jit(gray, mask, y0, y1, x0, x1):
+    """
+    Sum of Sobel gx² + gy² over mask pixels inside [y0:y1, x0:x1], fused.
+
+    Gradients, squares, the mask test and the reduction happen in one pass
+    with no intermediate images; rows run in parallel.
+    """
+    total = 0.0
+    for y in prange(y0, y1):
+        total += _masked_sobel_energy_row(gray, mask, y, x0, x1)
+    return total
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _masked_sobel_energy_stack_jit(stack, mask, y0, y1, x0, x1):
+    """
+    `_masked_sobel_energy_sum_jit` for every frame of an (n, H, W) stack.
+
+    One kernel launch for the whole stack, parallel over frames (each frame
+    is walked serially), instead of n Python-level calls.
+    """
+    n = stack.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for k in prange(n):
+        gray = stack[k]
+        total = 0.0
+        for y in range(y0, y1):
+            total += _masked_sobel_energy_row(gray, mask, y, x0, x1)
+        out[k] = total
+    return out
+
+
+def _tenengrad_in_mask_from_gray(
+    gray: np.ndarray,
+    mask: np.ndarray,
+    workspace: GradientWorkspace | None = None,
+) -> float:
+    """Masked Tenengrad on an already-2D grayscale image (no conversion)."""
+    if mask.shape != gray.shape:
+        raise ValueError(
+            f"Mask shape {mask.shape} does not match image shape {gray.shape}."
+        )
+    if workspace is not None and workspace.g2.shape != gray.shape:
         raise ValueError(
-            f"Mask shape {mask.shape} does not match image shape {g2.shape}."
+            f"Workspace shape {workspace.g2.shape} does not match image shape {gray.shape}."
         )
 
-    values = g2[mask]
-    if values.size == 0:
+    mask_u8 = _as_mask_u8(mask)
+    if not mask_u8.any():
         return 0.0
 
-    return float(values.mean())
+    # Only pixels under the mask contribute, so I filter just the mask's
+    # bounding box (plus the Sobel margin) instead of the whole frame.
+    outer, inner, box = _mask_bbox(mask_u8)
+
+    if HAVE_NUMBA and gray.dtype == np.uint8 and min(gray.shape) >= 2:
+        # One fused pass; the workspace buffers are not needed at all.
+        total = _masked_sobel_energy_sum_jit(
+            np.ascontiguousarray(gray), mask_u8,
+            box[0].start, box[0].stop, box[1].start, box[1].stop,
+        )
+        return float(total) / cv2.countNonZero(mask_u8[box])
+
+    crop = gray[outer]
+    if workspace is not None:
+        ch, cw = crop.shape
+        workspace = GradientWorkspace(
+            gray=workspace.gray[:ch, :cw],
+            gx=workspace.gx[:ch, :cw],
+            gy=workspace.gy[:ch, :cw],
+            g2=workspace.g2[:ch, :cw],
+        )
+    g2 = _sobel_energy(crop, workspace)[inner]
+
+    # cv2.mean reduces under the mask directly (double accumulator), so I
+    # never materialize g2[mask].
+    return float(cv2.mean(g2, mask=mask_u8[box])[0])
 
 
 # ---------------------------------------------------------------------------
 # 4) Siemens-specific focus metric
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=8)
+def _annulus_mask_u8(
+    shape: Tuple[int, int],
+    cx: float,
+    cy: float,
+    r_inner: float,
+    r_outer: float,
+) -> np.ndarray:
+    """
+    uint8 annulus mask for one geometry, cached.
+
+    The array is shared between callers, so I mark it read-only.
+    """
+    mask = make_annulus_mask(shape, (cx, cy), r_inner, r_outer).view(np.uint8)
+    mask.setflags(write=False)
+    return mask
+
+
+def siemens_focus_mask(
+    image: np.ndarray,
+    r_inner_frac: float = 0.4,
+    r_outer_frac: float = 0.8,
+    *,
+    params: SiemensParams | None = None,
+) -> np.ndarray:
+    """
+    Annulus mask used by the Siemens focus metric.
+
+    The Siemens geometry only depends on the frame shape, so across a focus
+    stack (same target, same camera) this mask is constant. I expose it so a
+    sweep can build it once and pass it to every `siemens_focus_metric` call,
+    and I also cache it per geometry, so frames scored one at a time do not
+    rebuild it either.
+
+    Parameters
+    ----------
+    image : np.ndarray
+        Any frame of the sweep (only its shape is used).
+    r_inner_frac, r_outer_frac : float
+        Annulus radius fractions of the estimated star radius.
+    params : SiemensParams, optional
+        Precomputed star geometry. If None, I estimate it from `image`.
+
+    Returns
+    -------
+    np.ndarray of uint8
+        (H, W) annulus mask with values 0/1, ready for OpenCV's masked
+        reductions without any per-frame conversion. It is a shared,
+        read-only array; copy it before modifying.
+    """
+    if params is None:
+        params = estimate_center_and_radius(image)
+    return _annulus_mask_u8(
+        tuple(image.shape[:2]),
+        float(params.cx),
+        float(params.cy),
+        float(r_inner_frac * params.radius),
+        float(r_outer_frac * params.radius),
+    )
+
+
 def siemens_focus_metric(
     image: np.ndarray,
     r_inner_frac: float = 0.4,
     r_outer_frac: float = 0.8,
+    workspace: GradientWorkspace | None = None,
+    *,
+    mask: np.ndarray | None = None,
 ) -> float:
     """
     Siemens-specific focus metric.
@@ -179,17 +573,116 @@ def siemens_focus_metric(
         Inner radius fraction.
     r_outer_frac : float
         Outer radius fraction.
+    workspace : GradientWorkspace, optional
+        Reusable gradient buffers for the masked Tenengrad.
+    mask : np.ndarray, optional
+        Precomputed annulus (see `siemens_focus_mask`). When given, I skip
+        steps 1) and 2) and the radius fractions are ignored.
 
     Returns
     -------
     float
         Siemens-targeted sharpness metric.
     """
-    gray = _to_float_gray(image)
+    # Convert once; the internal primitive skips the public wrapper's
+    # conversion step.
+    gray = _to_gray(image)
+
+    if mask is None:
+        mask = siemens_focus_mask(gray, r_inner_frac, r_outer_frac)
+    return _tenengrad_in_mask_from_gray(gray, mask, workspace)
+
+
+def siemens_focus_metric_stack(
+    stack: np.ndarray,
+    r_inner_frac: float = 0.4,
+    r_outer_frac: float = 0.8,
+    batch_size: int = 16,
+    *,
+    params: SiemensParams | None = None,
+) -> np.ndarray:
+    """
+    Siemens focus metric for a whole (n, H, W) focus stack at once.
 
-    params = estimate_center_and_radius(gray)
-    r_inner = r_inner_frac * params.radius
-    r_outer = r_outer_frac * params.radius
+    Every frame in a stack shares the same shape, so the Siemens geometry and
+    the annulus mask are identical for all of them. I build the mask once and
+    compute the gradient energy for a batch of frames in a single vectorized
+    pass, instead of n separate Python-level calls.
+
+    Each frame gets its own 2D cv2.Sobel (nothing is filtered across frames),
+    so each entry equals `siemens_focus_metric(stack[i])`.
+
+    Parameters
+    ----------
+    stack : np.ndarray
+        (n, H, W) grayscale stack, e.g. from `MockCameraFocusStack.load_all()`.
+    r_inner_frac, r_outer_frac : float
+        Annulus radius fractions, as in `siemens_focus_metric`.
+    batch_size : int
+        Frames processed per vectorized pass. The two float32 gradient
+        buffers take 2 * batch_size * H * W * 4 bytes, allocated once.
+    params : SiemensParams, optional
+        Star geometry shared by every frame. If None, I estimate it once
+        from the first frame.
+
+    Returns
+    -------
+    np.ndarray
+        (n,) array of focus metric values.
+    """
+    if stack.ndim != 3:
+        raise ValueError(f"Expected an (n, H, W) stack, got shape {stack.shape}.")
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+
+    n = stack.shape[0]
+    mask_u8 = siemens_focus_mask(stack[0], r_inner_frac, r_outer_frac, params=params)
+
+    metrics = np.zeros(n, dtype=np.float64)
+    count = cv2.countNonZero(mask_u8)
+    if count == 0 or n == 0:
+        return metrics
+
+    # Only the annulus bounding box (plus the Sobel margin) is filtered.
+    outer, inner, box = _mask_bbox(mask_u8)
+
+    if HAVE_NUMBA and stack.dtype == np.uint8 and min(stack.shape[1:]) >= 2:
+        # The fused kernel needs no gradient buffers: one launch scores
+        # every frame, in parallel over frames.
+        metrics = _masked_sobel_energy_stack_jit(
+            np.ascontiguousarray(stack), mask_u8,
+            box[0].start, box[0].stop, box[1].start, box[1].stop,
+        )
+        metrics /= count
+        return metrics
+
+    # ufunc `where=` wants bool; this is one small box-sized array per stack.
+    mask = mask_u8[box] != 0
+
+    # One pair of (batch, h, w) float32 gradient buffers for the whole stack:
+    # cv2.Sobel writes each frame straight into its slice, then the energy
+    # and masked sums are single vectorized passes over the batch.
+    frames = stack[:, outer[0], outer[1]]
+    batch = min(batch_size, n)
+    gx = np.empty((batch,) + frames.shape[1:], dtype=np.float32)
+    gy = np.empty_like(gx)
+
+    for start in range(0, n, batch_size):
+        chunk = frames[start:start + batch_size]
+        m = chunk.shape[0]
+        for j in range(m):
+            src = chunk[j]
+            if src.dtype not in _CV_INPUT_DTYPES:
+                src = src.astype(np.float32)
+            cv2.Sobel(src, cv2.CV_32F, 1, 0, dst=gx[j], ksize=3)
+            cv2.Sobel(src, cv2.CV_32F, 0, 1, dst=gy[j], ksize=3)
+
+        np.multiply(gx[:m], gx[:m], out=gx[:m])
+        np.multiply(gy[:m], gy[:m], out=gy[:m])
+        gx[:m] += gy[:m]
+        metrics[start:start + m] = gx[:m, inner[0], inner[1]].sum(
+            axis=(1, 2), where=mask, dtype=np.float64
+        )
 
-    mask = make_annulus_mask(gray.shape, (params.cx, params.cy), r_inner, r_outer)
-    return tenengrad_in_mask(gray, mask)
+    metrics /= count
+    return metrics
@@ -18,8 +18,16 @@ from __future__ import annotations
 from typing import Tuple
 
 import numpy as np
+import scipy.fft
 
-from bench.targets import estimate_center_and_radius, sample_radial_profile
+from bench._numba import HAVE_NUMBA, njit, prange
+from bench.targets import SiemensParams, estimate_center_and_radius
+from bench.targets.siemens import (
+    _gray_for_sampling,
+    _sample_profiles_bilinear,
+    _sample_profiles_f32,
+    _sample_radial_profile_gray,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -31,6 +39,7 @@ def mtf_siemens_spectrum_single_radius(
     center: Tuple[float, float] | None = None,
     radius: float | None = None,
     num_angles: int = 2048,
+    params: SiemensParams | None = None,
 ) -> tuple[np.ndarray, np.ndarray]:
     """
     DEBUG / LEGACY:
@@ -40,6 +49,9 @@ def mtf_siemens_spectrum_single_radius(
     troubleshooting. Sometimes I use it to confirm that the Siemens spokes
     have the expected harmonic structure before running the full algorithm.
 
+    `params` is a precomputed Siemens geometry (see
+    `estimate_center_and_radius`); if None I estimate it from `img`.
+
     Returns
     -------
     freq_norm : np.ndarray
@@ -50,7 +62,8 @@ def mtf_siemens_spectrum_single_radius(
     """
     arr = np.asarray(img)
 
-    params = estimate_center_and_radius(arr)
+    if params is None:
+        params = estimate_center_and_radius(arr)
     cx, cy, r_est = params.cx, params.cy, params.radius
 
     if center is not None:
@@ -58,16 +71,19 @@ def mtf_siemens_spectrum_single_radius(
     if radius is None:
         radius = 0.7 * r_est  # simple default to avoid clipping
 
-    profile = sample_radial_profile(arr, (cx, cy), radius=radius, num_angles=num_angles)
+    gray = _gray_for_sampling(arr)
+    profile = _sample_radial_profile_gray(gray, (cx, cy), radius, num_angles)
 
-    # Remove DC component
-    profile = profile.astype(np.float64)
-    profile = profile - profile.mean()
+    # Remove DC component. float32 is plenty for a normalized spectrum and
+    # halves the FFT's memory traffic.
+    profile = profile.astype(np.float32)
+    profile -= profile.mean()
 
-    fft_vals = np.fft.rfft(profile)
-    mag = np.abs(fft_vals)
+    # profile is a fresh array I own, so scipy may FFT it in place
+    fft_vals = scipy.fft.rfft(profile, workers=-1, overwrite_x=True)
+    mag = np.abs(fft_vals).astype(np.float64)
 
-    freqs = np.fft.rfftfreq(num_angles, d=1.0)
+    freqs = scipy.fft.rfftfreq(num_angles, d=1.0)
 
     # Normalize axes
     if freqs.max() > 0:
@@ -83,6 +99,66 @@ def mtf_siemens_spectrum_single_radius(
     return freq_norm, mtf_norm
 
 
+# ---------------------------------------------------------------------------
+# 1b) Single-bin DFT magnitude (Goertzel)
+# ---------------------------------------------------------------------------
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _modulation_at_k0(x, k):
+    """
+    |DFT(x[i] - mean(x[i]))[k]| for every row i, DC removal fused in.
+
+    Per row (rows in parallel): one pass for the mean, then Goertzel's
+    two-tap recurrence over x - mean. The row is a few KB, so the second
+    pass runs out of L1, and no centered copy of the batch is ever made.
+    Accumulates in float64 whatever the input dtype.
+    """
+    n_rows, n = x.shape
+    coeff = 2.0 * np.cos(2.0 * np.pi * k / n)
+    out = np.empty(n_rows, dtype=np.float64)
+    for i in prange(n_rows):
+        total = 0.0
+        for j in range(n):
+            total += x[i, j]
+        mean = total / n
+
+        s1 = 0.0
+        s2 = 0.0
+        for j in range(n):
+            s = (x[i, j] - mean) + coeff * s1 - s2
+            s2 = s1
+            s1 = s
+        power = s1 * s1 + s2 * s2 - coeff * s1 * s2
+        out[i] = np.sqrt(max(power, 0.0))
+    return out
+
+
+def _dft_magnitude_rows(x: np.ndarray, k: int) -> np.ndarray:
+    """
+    Magnitude of DFT bin `k` of each mean-removed row of a 2D array, float64.
+
+    Equal to np.abs(np.fft.rfft(x - x.mean(axis=1, keepdims=True),
+    axis=1))[:, k] without computing the other bins or the centered copy:
+    fused Goertzel under Numba, otherwise a projection onto the zero-mean
+    cos/sin basis vectors of bin k (two BLAS mat-vecs; for k != 0 the
+    basis is orthogonal to DC, so the row means drop out).
+    """
+    if HAVE_NUMBA:
+        return _modulation_at_k0(x, k)
+
+    n = x.shape[1]
+    phase = 2.0 * np.pi * k * np.arange(n) / n
+    cos_k = np.cos(phase)
+    sin_k = np.sin(phase)
+    # Remove the (rounding-level) DC of the basis so large row means in
+    # float32 cannot leak into the result.
+    cos_k -= cos_k.mean()
+    sin_k -= sin_k.mean()
+    re = x @ cos_k.astype(x.dtype)
+    im = x @ sin_k.astype(x.dtype)
+    return np.hypot(re, im).astype(np.float64)
+
+
 # ---------------------------------------------------------------------------
 # 2) Siemens multi-radius MTF proxy
 # ---------------------------------------------------------------------------
@@ -94,6 +170,8 @@ def mtf_siemens_multi_radius(
     r_max_frac: float = 0.9,
     num_radii: int = 20,
     num_angles: int = 2048,
+    params: SiemensParams | None = None,
+    bilinear: bool = False,
 ) -> tuple[np.ndarray, np.ndarray]:
     """
     Estimate a Siemens-based MTF curve by sweeping multiple radii.
@@ -115,8 +193,8 @@ def mtf_siemens_multi_radius(
       3) At each radius:
            * sample angular profile (num_angles samples)
            * subtract mean (remove DC)
-           * take FFT
-           * extract magnitude at the fundamental spoke harmonic (k0)
+           * measure the magnitude at the fundamental spoke harmonic (k0),
+             found once from the FFT of the outer radius
       4) Convert radius → normalized spatial frequency
       5) Normalize modulation → [0, 1]
       6) Return a smooth MTF-like curve
@@ -144,7 +222,19 @@ def mtf_siemens_multi_radius(
         Number of radii to sweep between r_max_frac*R and r_min_frac*R.
 
     num_angles : int
-        Number of angular samples per radius.
+        Number of angular samples per radius. I round it up to the next
+        FFT-friendly length (a no-op for the default 2048) so an odd user
+        value never lands pocketfft on its slow prime-size path.
+
+    params : SiemensParams, optional
+        Precomputed center/radius. The geometry only depends on the frame
+        shape, so a caller that already has it (e.g. from the autofocus
+        stage) can pass it in. If None, I estimate it from `img`.
+
+    bilinear : bool
+        Sample the circles with bilinear interpolation (one cv2.remap call)
+        instead of nearest-neighbor. Slightly slower, but it avoids spoke
+        aliasing at the small radii that carry the high frequencies.
 
     Returns
     -------
@@ -158,77 +248,71 @@ def mtf_siemens_multi_radius(
     arr = np.asarray(img)
 
     # Step 0: find center & radius
-    params = estimate_center_and_radius(arr)
+    if params is None:
+        params = estimate_center_and_radius(arr)
     cx, cy, r_est = params.cx, params.cy, params.radius
 
     if center is not None:
         cx, cy = center
 
+    # Still uniform on [0, 2π), just never a slow FFT size
+    num_angles = scipy.fft.next_fast_len(num_angles, real=True)
+
     # Radii from outer (low freq) → inner (high freq)
     r_outer = r_max_frac * r_est
     r_inner = r_min_frac * r_est
     radii = np.linspace(r_outer, r_inner, num_radii)
+    if radii.size == 0:
+        raise RuntimeError("No valid radii found for Siemens MTF estimation.")
 
-    # Step 1: determine fundamental harmonic k0 at a reference radius
-    r_ref = r_outer
-    prof_ref = sample_radial_profile(arr, (cx, cy), radius=r_ref, num_angles=num_angles)
-    prof_ref = prof_ref.astype(np.float64)
-    prof_ref = prof_ref - prof_ref.mean()
+    # Step 1: sample every radius in one shot -> (num_radii, num_angles).
+    # float32 profiles -> complex64 FFT: half the memory traffic, and the
+    # 24-bit mantissa is ample for a peak search and relative modulation.
+    # DC is not removed here: the k0 measurement in step 3 fuses it in.
+    gray = _gray_for_sampling(arr)
+    if bilinear:
+        profiles = _sample_profiles_bilinear(gray, (cx, cy), radii, num_angles)
+    else:
+        profiles = _sample_profiles_f32(
+            gray, (cx, cy), radii, num_angles, remove_dc=False
+        )
 
-    fft_ref = np.fft.rfft(prof_ref)
-    mag_ref = np.abs(fft_ref)
+    # Step 2: one FFT of the reference radius (outer, row 0) to find the
+    # fundamental. I ignore DC (index 0) and take the largest remaining peak.
+    # The centered reference is a fresh row, so scipy may FFT it in place.
+    ref = profiles[0] - profiles[0].mean()
+    mag_ref = np.abs(scipy.fft.rfft(ref, workers=-1, overwrite_x=True))
 
     if mag_ref.size < 2:
         raise RuntimeError("FFT spectrum too small to estimate fundamental harmonic.")
 
-    # I ignore DC (index 0) and take the largest remaining peak as the fundamental
     k0 = 1 + int(np.argmax(mag_ref[1:]))
 
-    # Step 2: sweep radii and measure amplitude at k0
-    freqs_linear = []
-    mods = []
-
-    for r in radii:
-        profile = sample_radial_profile(arr, (cx, cy), radius=r, num_angles=num_angles)
-        profile = profile.astype(np.float64)
-        profile = profile - profile.mean()
-
-        fft_vals = np.fft.rfft(profile)
-        mag = np.abs(fft_vals)
+    # k0 comes from an argmax over mag_ref[1:], and every radius shares
+    # num_angles, so k0 is a valid bin for all of them by construction.
+    assert k0 < mag_ref.size
 
-        if k0 >= mag.size:
-            # At very small radii, angular sampling may undersample k0
-            # I skip those safely. This is rare unless the image is tiny.
-            continue
-
-        # Modulation amplitude at fundamental harmonic
-        M = mag[k0]
-
-        # Linear spatial frequency (up to a constant factor)
-        f_linear = k0 / (2.0 * np.pi * r)
-
-        freqs_linear.append(f_linear)
-        mods.append(M)
-
-    freqs_linear = np.asarray(freqs_linear, dtype=float)
-    mods = np.asarray(mods, dtype=float)
-
-    if freqs_linear.size == 0:
-        raise RuntimeError("No valid radii found for Siemens MTF estimation.")
+    # Step 3: modulation amplitude at k0 only (Goertzel, O(N) per radius
+    # instead of a full spectrum), and the linear spatial frequency (up to
+    # a constant factor) at each radius
+    mods = _dft_magnitude_rows(profiles, k0)
+    freqs_linear = k0 / (2.0 * np.pi * radii)
 
-    # Step 3: sort by increasing frequency
-    order = np.argsort(freqs_linear)
-    freqs_linear = freqs_linear[order]
-    mods = mods[order]
+    # Step 4: order by increasing frequency. radii come from a linspace, so
+    # f ∝ 1/r is already monotonic: increasing for the usual outer → inner
+    # sweep, and only needs a flip if r_min_frac > r_max_frac. No sort.
+    if freqs_linear[0] > freqs_linear[-1]:
+        freqs_linear = freqs_linear[::-1]
+        mods = mods[::-1]
 
-    # Step 4: normalize frequency to [0, 1]
+    # Step 5: normalize frequency to [0, 1]
     f_max = freqs_linear.max()
     if f_max > 0:
         freq_norm = freqs_linear / f_max
     else:
         freq_norm = freqs_linear
 
-    # Step 5: normalize modulation to [0, 1]
+    # Step 6: normalize modulation to [0, 1]
     M_max = mods.max()
     if M_max > 0:
         mtf_norm = mods / M_max
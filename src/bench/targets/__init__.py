@@ -6,12 +6,14 @@ Currently implemented:
 """
 
 from .siemens import (
+    SiemensParams,
     estimate_center_and_radius,
     make_annulus_mask,
     sample_radial_profile,
 )
 
 __all__ = [
+    "SiemensParams",
     "estimate_center_and_radius",
     "make_annulus_mask",
     "sample_radial_profile",
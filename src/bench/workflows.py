@@ -17,17 +17,72 @@ with a physical capture, this high-level pipeline stays the same.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import json
 from pathlib import Path
 from typing import Dict, Any
 
 import numpy as np
 import cv2
-import matplotlib.pyplot as plt
 
+from bench._threads import limit_inner_threads
 from bench.autofocus import scan_autofocus_stack_siemens
-from bench.instruments import MockCameraFocusStack
 from bench.metrics import mtf_siemens_multi_radius
+from bench.targets import estimate_center_and_radius
+
+# BENCH_PARALLEL_FRAMES=1: frame-level parallelism owns the cores, so OpenCV
+# and friends run single-threaded inside each frame task.
+limit_inner_threads()
+
+
+def _save_table(path: Path, data: np.ndarray, header: str, csv_format: str) -> Path:
+    """
+    Save a small 2-column result table and return the path actually written.
+
+    "text" keeps the human-readable CSV. "binary" writes the same array
+    with np.save (next to where the CSV would be, with a .npy suffix),
+    which skips all per-value text formatting; np.load reads it back
+    exactly, with the columns in the same order as the CSV header.
+    """
+    if csv_format == "binary":
+        path = path.with_suffix(".npy")
+        np.save(path, data)
+        return path
+
+    np.savetxt(path, data, delimiter=",", header=header, comments="")
+    return path
+
+
+def _save_line_plot(
+    path: Path,
+    x: np.ndarray,
+    y: np.ndarray,
+    xlabel: str,
+    ylabel: str,
+    title: str,
+) -> None:
+    """
+    Save a simple marker line plot as PNG.
+
+    I use matplotlib's object-oriented Figure on an explicit Agg canvas
+    rather than pyplot: the pyplot state machine is not thread-safe, these
+    plots are rendered on a worker thread, and nothing here needs a GUI
+    backend. matplotlib is imported lazily, so `make_plots=False` runs (and
+    plain imports of this module) never pay for it.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.plot(x, y, marker="o")
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    ax.grid(True)
+    fig.tight_layout()
+    fig.savefig(path, dpi=120)
 
 
 def run_focus_and_mtf(
@@ -40,6 +95,8 @@ def run_focus_and_mtf(
     r_max_frac: float = 0.9,
     num_radii: int = 20,
     make_plots: bool = True,
+    bilinear: bool = False,
+    csv_format: str = "text",
 ) -> Dict[str, Any]:
     """
     End-to-end workflow (simulation mode):
@@ -56,7 +113,8 @@ def run_focus_and_mtf(
     Parameters
     ----------
     stack_pattern : str
-        Glob pattern for the focus stack, e.g. "data/focus_stack/*.png".
+        Glob pattern for the focus stack, e.g. "data/focus_stack/*.png",
+        or a single stack file (see `bench.instruments.open_focus_stack`).
     z_start_um : float
         Starting z position in micrometers. Only used for labeling.
     z_end_um : float
@@ -73,12 +131,23 @@ def run_focus_and_mtf(
         Number of radii to sample between r_max and r_min.
     make_plots : bool
         If True, save PNG plots in addition to CSVs.
+    bilinear : bool
+        If True, sample the MTF circles bilinearly instead of nearest-neighbor.
+    csv_format : str
+        "text" (default) writes the autofocus and MTF curves as CSV;
+        "binary" writes them as .npy arrays instead (same columns).
 
     Returns
     -------
     summary : dict
         Dictionary with key results (best_z, best_index, file paths, etc.).
+        The curve files are under "autofocus_table" / "mtf_table", with
+        "table_format" ("csv" or "npy"); text output also keeps the
+        older "autofocus_csv" / "mtf_csv" keys.
     """
+    if csv_format not in ("text", "binary"):
+        raise ValueError(f"csv_format must be 'text' or 'binary', got {csv_format!r}")
+
     out_dir.mkdir(parents=True, exist_ok=True)
 
     # ------------------------------------------------------------------
@@ -94,84 +163,86 @@ def run_focus_and_mtf(
     positions = af_result.positions_um
     metrics = af_result.metrics
 
-    # Best index
-    best_idx = int(np.argmax(metrics))
-    best_z = float(positions[best_idx])
-    best_metric = float(metrics[best_idx])
+    best_idx = af_result.best_index
+    best_z = af_result.best_z_um
+    best_metric = af_result.best_metric
 
     # Save autofocus CSV
     af_csv = out_dir / "autofocus_curve.csv"
     af_data = np.column_stack([positions, metrics])
-    np.savetxt(
-        af_csv,
-        af_data,
-        delimiter=",",
-        header="z_um,siemens_focus_metric",
-        comments="",
-    )
+    af_csv = _save_table(af_csv, af_data, "z_um,siemens_focus_metric", csv_format)
 
-    # Save autofocus plot
-    af_plot = None
-    if make_plots:
-        plt.figure()
-        plt.plot(positions, metrics, marker="o")
-        plt.xlabel("Stage position [µm]")
-        plt.ylabel("Siemens focus metric")
-        plt.title("Autofocus scan on Siemens focus stack")
-        plt.grid(True)
-        plt.tight_layout()
-        af_plot = out_dir / "autofocus_curve.png"
-        plt.savefig(af_plot, dpi=120)
-        plt.close()
+    # PNG artifacts (plots, best frame) are written on a small thread pool
+    # so rendering/encoding overlaps the MTF computation below. Agg and
+    # cv2.imwrite release the GIL for the heavy parts.
+    with ThreadPoolExecutor(max_workers=2) as writer:
+        pending = []
 
-    # ------------------------------------------------------------------
-    # 2) Grab best-focus frame from stack
-    # ------------------------------------------------------------------
-    # I use a simple mock-camera abstraction so that the autofocus pipeline
-    # behaves the same whether images come from disk, a frame grabber,
-    # or a real camera later.
-    cam = MockCameraFocusStack(stack_pattern)
-    cam.set_index(best_idx)
-    best_img = cam.grab()
+        # Save autofocus plot
+        af_plot = None
+        if make_plots:
+            af_plot = out_dir / "autofocus_curve.png"
+            pending.append(writer.submit(
+                _save_line_plot,
+                af_plot,
+                positions,
+                metrics,
+                xlabel="Stage position [µm]",
+                ylabel="Siemens focus metric",
+                title="Autofocus scan on Siemens focus stack",
+            ))
 
-    best_img_path = out_dir / f"best_focus_frame_{best_idx:02d}.png"
-    cv2.imwrite(str(best_img_path), best_img)
+        # ------------------------------------------------------------------
+        # 2) Best-focus frame
+        # ------------------------------------------------------------------
+        # The autofocus pass already decoded every frame and kept the best one,
+        # so I do not go back to disk for it.
+        best_img = af_result.best_image
 
-    # ------------------------------------------------------------------
-    # 3) Siemens MTF (multi-radius) at best focus
-    # ------------------------------------------------------------------
-    # This step is the same whether the image came from disk or a physical camera.
-    freq_norm, mtf_norm = mtf_siemens_multi_radius(
-        best_img,
-        center=None,
-        r_min_frac=r_min_frac,
-        r_max_frac=r_max_frac,
-        num_radii=num_radii,
-        num_angles=angles,
-    )
+        best_img_path = out_dir / f"best_focus_frame_{best_idx:02d}.png"
+        pending.append(writer.submit(cv2.imwrite, str(best_img_path), best_img))
 
-    mtf_csv = out_dir / "mtf_siemens_multi_radius.csv"
-    mtf_data = np.column_stack([freq_norm, mtf_norm])
-    np.savetxt(
-        mtf_csv,
-        mtf_data,
-        delimiter=",",
-        header="freq_norm,mtf_norm",
-        comments="",
-    )
+        # ------------------------------------------------------------------
+        # 3) Siemens MTF (multi-radius) at best focus
+        # ------------------------------------------------------------------
+        # This step is the same whether the image came from disk or a physical camera.
+        # The star geometry is fixed for this image; I estimate it once here and
+        # hand it down.
+        params = estimate_center_and_radius(best_img)
+        freq_norm, mtf_norm = mtf_siemens_multi_radius(
+            best_img,
+            center=None,
+            r_min_frac=r_min_frac,
+            r_max_frac=r_max_frac,
+            num_radii=num_radii,
+            num_angles=angles,
+            params=params,
+            bilinear=bilinear,
+        )
 
-    mtf_plot = None
-    if make_plots:
-        plt.figure()
-        plt.plot(freq_norm, mtf_norm, marker="o")
-        plt.xlabel("Normalized spatial frequency")
-        plt.ylabel("Normalized MTF (Siemens multi-radius)")
-        plt.title("Siemens-based MTF at best focus")
-        plt.grid(True)
-        plt.tight_layout()
-        mtf_plot = out_dir / "mtf_siemens_multi_radius.png"
-        plt.savefig(mtf_plot, dpi=120)
-        plt.close()
+        mtf_csv = out_dir / "mtf_siemens_multi_radius.csv"
+        mtf_data = np.column_stack([freq_norm, mtf_norm])
+        mtf_csv = _save_table(mtf_csv, mtf_data, "freq_norm,mtf_norm", csv_format)
+
+        mtf_plot = None
+        if make_plots:
+            mtf_plot = out_dir / "mtf_siemens_multi_radius.png"
+            pending.append(writer.submit(
+                _save_line_plot,
+                mtf_plot,
+                freq_norm,
+                mtf_norm,
+                xlabel="Normalized spatial frequency",
+                ylabel="Normalized MTF (Siemens multi-radius)",
+                title="Siemens-based MTF at best focus",
+            ))
+
+    # Leaving the `with` block waits for every queued write, also when a
+    # step above raised, so no plot/image job is abandoned mid-way. Every
+    # artifact must be on disk before the summary points at it; .result()
+    # also re-raises any write error here.
+    for fut in pending:
+        fut.result()
 
     # ------------------------------------------------------------------
     # 4) Summary JSON
@@ -183,10 +254,12 @@ def run_focus_and_mtf(
         "best_index": best_idx,
         "best_z_um": best_z,
         "best_metric": best_metric,
-        "autofocus_csv": str(af_csv),
+        # Neutral keys: the tables are CSV or .npy depending on table_format.
+        "table_format": "csv" if csv_format == "text" else "npy",
+        "autofocus_table": str(af_csv),
         "autofocus_plot": str(af_plot) if af_plot is not None else None,
         "best_focus_image": str(best_img_path),
-        "mtf_csv": str(mtf_csv),
+        "mtf_table": str(mtf_csv),
         "mtf_plot": str(mtf_plot) if mtf_plot is not None else None,
         "angles": int(angles),
         "r_min_frac": float(r_min_frac),
@@ -194,6 +267,12 @@ def run_focus_and_mtf(
         "num_radii": int(num_radii),
     }
 
+    if csv_format == "text":
+        # The original keys, kept for existing readers; they only ever
+        # point at real CSV files.
+        summary["autofocus_csv"] = str(af_csv)
+        summary["mtf_csv"] = str(mtf_csv)
+
     summary_path = out_dir / "summary.json"
     with summary_path.open("w", encoding="utf-8") as f:
         json.dump(summary, f, indent=2)
@@ -23,14 +23,25 @@ which is called from `bench.cli` for the `focus-and-mtf-hw` command.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional, TYPE_CHECKING, List
+from types import ModuleType
+from typing import Any, Callable, Dict, Optional, TYPE_CHECKING, List, Tuple
+import importlib
 import json
+import os
+import queue
+import threading
 import time
 
 import numpy as np
 import cv2
 
+try:
+    import orjson  # type: ignore[import]
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
 if TYPE_CHECKING:  # for type-checkers only; avoids runtime circular import
     from .cli import FocusAndMTFHWConfig
 
@@ -51,6 +62,16 @@ class DummyCamera:
     width: int = 640
     height: int = 480
 
+    def __post_init__(self) -> None:
+        # The ramp never changes, so I build it once; every grab reuses the
+        # same noise and output buffers instead of allocating temporaries.
+        x = np.linspace(0, 1, self.width, dtype=np.float32)
+        self._ramp = np.tile(x, (self.height, 1))
+        self._rng = np.random.default_rng()
+        self._noise = np.empty_like(self._ramp)
+        self._u8 = np.empty((self.height, self.width), dtype=np.uint8)
+        self._batch = np.empty((0, self.height, self.width), dtype=np.uint8)
+
     def open(self) -> None:
         print("[DummyCamera] open()")
 
@@ -58,13 +79,37 @@ class DummyCamera:
         print("[DummyCamera] close()")
 
     def grab_frame(self) -> np.ndarray:
-        """Return a synthetic image."""
-        # horizontal ramp + noise
-        x = np.linspace(0, 1, self.width, dtype=np.float32)
-        img = np.tile(x, (self.height, 1))
-        noise = 0.03 * np.random.randn(self.height, self.width).astype(np.float32)
-        img = np.clip(img + noise, 0, 1)
-        return (img * 255).astype(np.uint8)
+        """
+        Return a synthetic image.
+
+        The returned array is an internal buffer, overwritten by the next
+        call (like a real camera's frame buffer); copy it to keep it.
+        """
+        self._render(self._u8)
+        return self._u8
+
+    def grab_batch(self, n: int) -> np.ndarray:
+        """
+        Return `n` synthetic frames as one (n, H, W) uint8 array.
+
+        Like grab_frame(), the array is an internal buffer reused by the
+        next call.
+        """
+        if self._batch.shape[0] != n:
+            self._batch = np.empty((n, self.height, self.width), dtype=np.uint8)
+        for frame in self._batch:
+            self._render(frame)
+        return self._batch
+
+    def _render(self, out: np.ndarray) -> None:
+        # horizontal ramp + noise, all in place
+        img = self._noise
+        self._rng.standard_normal(out=img, dtype=np.float32)
+        img *= 0.03
+        img += self._ramp
+        np.clip(img, 0, 1, out=img)
+        # One fused pass: scale by 255, round and saturate into uint8.
+        cv2.convertScaleAbs(img, dst=out, alpha=255.0)
 
 
 @dataclass
@@ -81,6 +126,7 @@ class OpenCVCamera:
       - open()
       - close()
       - grab_frame() -> np.ndarray (uint8, BGR)
+      - grab_batch(n) -> np.ndarray (n, H, W, 3)
 
     For my v1 release I keep this backend intentionally simple; if I move to a
     dedicated SDK (e.g. Spinnaker/PySpin) I can slot that in behind the same API.
@@ -88,8 +134,14 @@ class OpenCVCamera:
 
     device_index: int = 0
 
+    # Frames OpenCV's V4L2 backend queues by default, assumed when the
+    # backend will not tell me its buffer size.
+    _DEFAULT_BUFFER_FRAMES = 4
+
     def __post_init__(self) -> None:
         self.cap: Optional[cv2.VideoCapture] = None
+        self._stale_frames = self._DEFAULT_BUFFER_FRAMES
+        self._batch: Optional[np.ndarray] = None
 
     def open(self) -> None:
         print(f"[OpenCVCamera] Opening device index {self.device_index}")
@@ -99,6 +151,14 @@ class OpenCVCamera:
                 f"OpenCVCamera: could not open camera at index {self.device_index}"
             )
 
+        # A focus sweep grabs well under 1 fps, so anything queued in the
+        # driver was exposed before the last stage move. I shrink the queue
+        # to one frame where the backend allows it, and remember how many
+        # stale frames grab_frame() has to skip.
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        buffered = int(self.cap.get(cv2.CAP_PROP_BUFFERSIZE))
+        self._stale_frames = buffered if buffered > 0 else self._DEFAULT_BUFFER_FRAMES
+
     def close(self) -> None:
         print("[OpenCVCamera] close()")
         if self.cap is not None:
@@ -106,11 +166,54 @@ class OpenCVCamera:
             self.cap = None
 
     def grab_frame(self) -> np.ndarray:
+        """
+        Return a frame exposed after this call started (not a queued one).
+
+        I split read() into grab() + retrieve(): the stale buffered frames
+        are grabbed and dropped without being decoded, and only the final,
+        fresh frame is retrieved.
+        """
         if self.cap is None:
             raise RuntimeError("OpenCVCamera.grab_frame() called before open().")
-        ok, frame = self.cap.read()
+        self._drop_stale()
+        return self._grab_one(None)
+
+    def grab_batch(self, n: int) -> np.ndarray:
+        """
+        Return `n` consecutive fresh frames as one (n, H, W, C) array.
+
+        The stale queue is dropped once, then each frame is decoded by
+        retrieve() straight into its slice of a buffer that is reused by
+        the next call.
+        """
+        if self.cap is None:
+            raise RuntimeError("OpenCVCamera.grab_batch() called before open().")
+        self._drop_stale()
+        first = self._grab_one(None)
+        shape = (n,) + first.shape
+        if self._batch is None or self._batch.shape != shape:
+            self._batch = np.empty(shape, dtype=first.dtype)
+        self._batch[0] = first
+        for i in range(1, n):
+            self._grab_one(self._batch[i])
+        return self._batch
+
+    def _drop_stale(self) -> None:
+        # grab() without retrieve(): queued frames are never decoded.
+        for _ in range(self._stale_frames):
+            self.cap.grab()
+
+    def _grab_one(self, out: Optional[np.ndarray]) -> np.ndarray:
+        ok = self.cap.grab()
+        frame = None
+        if ok:
+            ok, frame = self.cap.retrieve(out)
         if not ok or frame is None:
             raise RuntimeError("OpenCVCamera: failed to grab frame from camera.")
+        if out is not None and frame is not out:
+            # The backend decoded into its own Mat (e.g. the size changed).
+            out[...] = frame
+            return out
         return frame
 
 
@@ -132,11 +235,57 @@ class DummyStage:
     def get_position(self) -> float:
         return self.position
 
+    def is_settled(self) -> bool:
+        # Moves are instantaneous, so there is never anything to wait for.
+        return True
+
 
 # ---------------------------------------------------------------------------
 # Backend factories
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
+def _import_instrument(module: str) -> ModuleType:
+    """
+    Import `bench.instruments.<module>` on first use (then cached).
+
+    Vendor stage drivers pull in optional SDKs, so I only import them when
+    their backend is actually requested.
+    """
+    try:
+        return importlib.import_module(f".instruments.{module}", __package__)
+    except ImportError as exc:
+        raise RuntimeError(
+            f"Requested a stage backend but could not import "
+            f"bench.instruments.{module}"
+        ) from exc
+
+
+# Backend name -> factory(config). Kept at module level so adding a backend
+# (or swapping one out in a test) is a one-line dict change.
+_CAMERA_BACKENDS: Dict[str, Callable[["FocusAndMTFHWConfig"], Any]] = {
+    "dummy": lambda config: DummyCamera(),
+    # For now, both map to a generic OpenCV camera. This should work for
+    # many FLIR USB/board cameras when exposed as UVC.
+    "opencv": lambda config: OpenCVCamera(device_index=config.camera_index),
+    "flir": lambda config: OpenCVCamera(device_index=config.camera_index),
+    # Placeholder for a future dedicated FLIR/PySpin implementation:
+    # "flir-spinnaker": lambda config: _import_instrument(
+    #     "flir_spinnaker").FlirSpinnakerCamera(...),
+}
+
+_STAGE_BACKENDS: Dict[str, Callable[["FocusAndMTFHWConfig"], Any]] = {
+    "dummy": lambda config: DummyStage(),
+    # Example – probably wraps PyVISA + SCPI stage. I keep this here as a
+    # hook for a future OV2311 + stage project.
+    # TODO: I will adjust this to my real API.
+    "visa": lambda config: _import_instrument("visa_stage").VISAStage(),
+    # Example – typical for Thorlabs stages driven by the Kinesis SDK.
+    # TODO: I will adjust this to my real API.
+    "kinesis": lambda config: _import_instrument("stage_kinesis").KinesisStage(),
+}
+
+
 def _open_camera(backend: str, config: "FocusAndMTFHWConfig") -> Any:
     """
     Return a camera object with at least:
@@ -144,82 +293,643 @@ def _open_camera(backend: str, config: "FocusAndMTFHWConfig") -> Any:
         - close()
         - grab_frame() -> np.ndarray
 
-    Backends:
+    Backends (see `_CAMERA_BACKENDS`):
       - 'dummy'  : synthetic ramp image.
       - 'opencv' : cv2.VideoCapture(camera_index).
       - 'flir'   : currently identical to 'opencv', assuming FLIR is UVC/DirectShow.
                    If I move to Spinnaker/PySpin later, I will replace this mapping.
+    """
+    try:
+        factory = _CAMERA_BACKENDS[backend.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown camera backend: {backend!r}") from None
+    return factory(config)
+
 
-    I keep the mapping small and explicit on purpose so it's obvious where to
-    plug in a future custom board-camera backend.
+def _open_stage(backend: str, config: "FocusAndMTFHWConfig") -> Any:
     """
-    backend = backend.lower()
+    Return a stage object with at least:
+        - move_to(z: float)
+        - get_position() -> float
 
-    if backend == "dummy":
-        return DummyCamera()
+    Right now I only rely on DummyStage; the VISA and Kinesis entries in
+    `_STAGE_BACKENDS` are placeholders showing where I will wire in real
+    motion hardware later.
+    """
+    try:
+        factory = _STAGE_BACKENDS[backend.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown stage backend: {backend!r}") from None
+    return factory(config)
 
-    if backend in ("opencv", "flir"):
-        # For now, both map to a generic OpenCV camera.
-        # This should work for many FLIR USB/board cameras when exposed as UVC.
-        return OpenCVCamera(device_index=config.camera_index)
 
-    # Placeholder for a future dedicated FLIR/PySpin implementation:
-    # if backend == "flir-spinnaker":
-    #     from .instruments import flir_spinnaker
-    #     return flir_spinnaker.FlirSpinnakerCamera(...)
+# ---------------------------------------------------------------------------
+# Background frame writer
+# ---------------------------------------------------------------------------
 
-    raise ValueError(f"Unknown camera backend: {backend!r}")
+# Buffer size for frame files: a whole encoded frame goes out in one write.
+_WRITE_BUFFER_BYTES = 1 << 20
 
 
-def _open_stage(backend: str, config: "FocusAndMTFHWConfig") -> Any:
+class _FrameWriter:
     """
-    Return a stage object with at least:
-        - move_to(z: float)
-        - get_position() -> float
+    Write captured frames to disk on background threads.
+
+    The capture loop only enqueues (path, frame) pairs; PNG encoding and
+    disk I/O happen here, overlapped with the next stage move and grab.
+    Several worker threads share the queue, and cv2.imencode releases the
+    GIL while it deflates, so PNG compression spreads over the cores.
+    The queue is bounded, so if the disk falls behind the capture loop
+    blocks instead of buffering frames without limit.
 
-    Right now I only rely on DummyStage; the VISA and Kinesis branches are
-    placeholders showing where I will wire in real motion hardware later.
+    A write error is re-raised in the capture thread on the next `put()` or
+    on `close()`, so a full disk never goes unnoticed.
     """
-    backend = backend.lower()
-    if backend == "dummy":
-        return DummyStage()
 
-    if backend == "visa":
-        # Example – probably wraps PyVISA + SCPI stage.
-        # I keep this here as a hook for a future OV2311 + stage project.
+    def __init__(
+        self,
+        maxsize: int = 8,
+        n_workers: int = 1,
+        png_compression: Optional[int] = None,
+    ) -> None:
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._error: Optional[BaseException] = None
+        # OpenCV's own default level when not given.
+        self._png_params: List[int] = (
+            [] if png_compression is None
+            else [cv2.IMWRITE_PNG_COMPRESSION, int(png_compression)]
+        )
+        self._threads = [
+            threading.Thread(target=self._run, name=f"frame-writer-{i}", daemon=True)
+            for i in range(max(1, n_workers))
+        ]
+        for t in self._threads:
+            t.start()
+
+    @property
+    def max_in_flight(self) -> int:
+        """Most items the writer can hold at once (queued + being written)."""
+        return self._queue.maxsize + len(self._threads)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            paths, frames, meta, on_done = item
+            try:
+                if self._error is None:  # drain without writing after a failure
+                    self._write_item(paths, frames, meta)
+            except BaseException as exc:  # re-raised in the capture thread
+                self._error = exc
+            finally:
+                if on_done is not None:
+                    on_done()  # hand the frames' buffer back to its owner
+
+    def _write_item(
+        self, paths: List[Path], frames: np.ndarray, meta: List[Dict[str, Any]]
+    ) -> None:
+        """Write one queued batch, one file per frame."""
+        for path, frame in zip(paths, frames):
+            if path.suffix == ".npy":
+                # Raw frames: no deflate, and MockCameraFocusStack
+                # reads them back with a plain np.load.
+                np.save(path, frame)
+            else:
+                self._write_encoded(path, frame)
+            print(f"[focus-and-mtf-hw] Saved frame: {path}")
+
+    def _write_encoded(self, path: Path, frame: np.ndarray) -> None:
+        """
+        Encode `frame` in memory, then write the bytes in one call.
+
+        Splitting cv2.imencode from the file write keeps the encoded buffer
+        in my hands (it could also feed a live preview without encoding
+        twice), and Python's file API copes with any path cv2.imwrite
+        might choke on (e.g. non-ASCII names on Windows).
+        """
+        ok, buf = cv2.imencode(path.suffix, frame, self._png_params)
+        if not ok:
+            raise RuntimeError(f"cv2.imencode failed for {path}")
+        # The encoded array supports the buffer protocol: no tobytes() copy.
+        with path.open("wb", buffering=_WRITE_BUFFER_BYTES) as f:
+            f.write(buf)
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise RuntimeError("Background frame writer failed.") from self._error
+
+    def put(self, path: Path, frame: np.ndarray) -> None:
+        """Queue one frame; the caller must not modify `frame` afterwards."""
+        self.put_batch([path], frame[np.newaxis])
+
+    def put_batch(
+        self,
+        paths: List[Path],
+        frames: np.ndarray,
+        meta: Optional[List[Dict[str, Any]]] = None,
+        on_done: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Queue a (K, H, W) stack as one item, frame k going to `paths[k]`.
+
+        `meta` optionally carries one dict per frame (e.g. z and repeat
+        index) for writers that keep an index. The caller must not modify
+        `frames` until `on_done` is called; a worker calls it once it is
+        finished with the item (written, or dropped after a failure).
+        """
+        if meta is None:
+            meta = [{} for _ in paths]
+        if not len(paths) == len(frames) == len(meta):
+            raise ValueError("put_batch() needs one path (and meta entry) per frame.")
         try:
-            from .instruments import visa_stage
-        except ImportError as exc:
-            raise RuntimeError(
-                "Requested stage backend 'visa' but could not import "
-                "bench.instruments.visa_stage"
-            ) from exc
-        return visa_stage.VISAStage()  # TODO: I will adjust this to my real API.
+            self._raise_if_failed()
+        except BaseException:
+            if on_done is not None:
+                on_done()
+            raise
+        self._queue.put((paths, frames, meta, on_done))
+
+    def close(self, raise_errors: bool = True) -> None:
+        """
+        Flush every queued frame and stop the threads (idempotent).
+
+        With `raise_errors=False` a write failure is swallowed; I use that
+        on the error path so it does not mask the original exception.
+        """
+        alive = [t for t in self._threads if t.is_alive()]
+        for _ in alive:
+            self._queue.put(None)  # one sentinel per worker
+        for t in alive:
+            t.join()
+        if raise_errors:
+            self._raise_if_failed()
+
+
+class _ContainerWriter(_FrameWriter):
+    """
+    Append every frame to one container file instead of one file per frame.
+
+    Hundreds of small frame files are slow to create, copy and list; a
+    single chunked container is written (and later read) sequentially.
+    Supported containers:
+      - 'npy' : one (N, H, W) `frames.npy`, written as a raw stream behind
+                a .npy header that is patched with the final N on close.
+                `open_focus_stack` memory-maps it directly.
+      - 'h5'  : `frames.h5` with a resizable, LZF-compressed "frames"
+                dataset chunked per frame (needs h5py).
+
+    Next to it I write `frames_index.json`, mapping each frame index to
+    its name, z and repeat index k. A single writer thread keeps frames in
+    capture order.
+    """
 
-    if backend == "kinesis":
-        # Example – typical for Thorlabs stages driven by the Kinesis SDK.
-        try:
-            from .instruments import stage_kinesis
-        except ImportError as exc:
-            raise RuntimeError(
-                "Requested stage backend 'kinesis' but could not import "
-                "bench.instruments.stage_kinesis"
-            ) from exc
-        return stage_kinesis.KinesisStage()  # TODO: I will adjust this to my real API.
+    def __init__(self, path: Path, kind: str, maxsize: int = 8) -> None:
+        if kind not in ("npy", "h5"):
+            raise ValueError(f"Unknown frame container: {kind!r}")
+        if kind == "h5":
+            try:
+                import h5py  # type: ignore[import]
+            except ImportError as exc:
+                raise RuntimeError(
+                    "The 'h5' frame container requires h5py (pip install h5py)."
+                ) from exc
+            self._h5py = h5py
+        self._path = path
+        self._kind = kind
+        self._file: Any = None
+        self._dataset: Any = None
+        self._frame_shape: Optional[Tuple[int, ...]] = None
+        self._dtype: Optional[np.dtype] = None
+        self._n = 0
+        self._index: List[Dict[str, Any]] = []
+        self._finalized = False
+        super().__init__(maxsize=maxsize, n_workers=1)
+
+    def _open(self, frames: np.ndarray) -> None:
+        self._frame_shape = frames.shape[1:]
+        self._dtype = frames.dtype
+        if self._kind == "npy":
+            self._file = self._path.open("wb", buffering=_WRITE_BUFFER_BYTES)
+            self._write_npy_header(0)
+            self._data_offset = self._file.tell()
+        else:
+            self._file = self._h5py.File(self._path, "w", libver="latest")
+            self._dataset = self._file.create_dataset(
+                "frames",
+                shape=(0,) + self._frame_shape,
+                maxshape=(None,) + self._frame_shape,
+                dtype=self._dtype,
+                chunks=(1,) + self._frame_shape,
+                compression="lzf",
+            )
 
-    raise ValueError(f"Unknown stage backend: {backend!r}")
+    def _write_npy_header(self, n: int) -> None:
+        # NumPy pads the header so the leading dimension can grow in place,
+        # which is what lets me rewrite it with the final count on close.
+        np.lib.format.write_array_header_1_0(
+            self._file,
+            {
+                "descr": np.lib.format.dtype_to_descr(self._dtype),
+                "fortran_order": False,
+                "shape": (n,) + self._frame_shape,
+            },
+        )
+
+    def _write_item(
+        self, paths: List[Path], frames: np.ndarray, meta: List[Dict[str, Any]]
+    ) -> None:
+        if self._file is None:
+            self._open(frames)
+        if frames.shape[1:] != self._frame_shape or frames.dtype != self._dtype:
+            raise ValueError(
+                f"Frame batch {frames.shape} {frames.dtype} does not match the "
+                f"container's {self._frame_shape} {self._dtype}."
+            )
+
+        k = len(frames)
+        if self._kind == "npy":
+            self._file.write(np.ascontiguousarray(frames))
+        else:
+            self._dataset.resize(self._n + k, axis=0)
+            self._dataset[self._n:self._n + k] = frames
+
+        for j, (path, info) in enumerate(zip(paths, meta)):
+            self._index.append({"frame": self._n + j, "name": path.stem, **info})
+        self._n += k
+        print(f"[focus-and-mtf-hw] Saved {k} frame(s) to {self._path} (total {self._n})")
+
+    def _finalize(self) -> None:
+        if self._finalized:
+            return
+        self._finalized = True
+        if self._file is None:
+            return  # nothing was captured
+        if self._kind == "npy":
+            end = self._file.tell()
+            self._file.seek(0)
+            self._write_npy_header(self._n)
+            if self._file.tell() != self._data_offset:
+                raise RuntimeError(f"Could not patch the .npy header of {self._path}")
+            self._file.seek(end)
+        self._file.close()
+        _write_json(
+            self._path.with_name("frames_index.json"),
+            {"container": self._path.name, "frames": self._index},
+        )
+
+    def close(self, raise_errors: bool = True) -> None:
+        """Flush queued frames, then patch/close the container (idempotent)."""
+        super().close(raise_errors=False)
+        try:
+            self._finalize()
+        except BaseException as exc:
+            if self._error is None:
+                self._error = exc
+        if raise_errors:
+            self._raise_if_failed()
 
 
 # ---------------------------------------------------------------------------
 # Core workflow
 # ---------------------------------------------------------------------------
 
-def _compute_positions(z_start: float, z_end: float, z_step: float) -> List[float]:
+def _json_default(obj: Any) -> Any:
+    """Make NumPy arrays/scalars JSON-serializable for the stdlib encoder."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_json(path: Path, obj: Any) -> None:
+    """
+    Write a plan/summary JSON file.
+
+    With orjson installed I write indented JSON in one fast call (NumPy
+    arrays serialize natively). Otherwise I fall back to the stdlib
+    encoder in compact mode, which is several times faster than indent=2
+    on long position lists.
+    """
+    if orjson is not None:
+        path.write_bytes(
+            orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        )
+        return
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(obj, f, default=_json_default)
+
+
+def _compute_positions(z_start: float, z_end: float, z_step: float) -> np.ndarray:
+    """
+    Uniform sweep positions from z_start toward z_end, as a float64 array.
+
+    I return an array (not a list) so downstream numeric work, e.g. fitting
+    the focus curve, can use it directly; JSON gets `.tolist()`.
+    """
     if z_step == 0:
         raise ValueError("z_step must be non-zero.")
     # Include end point (within half-step tolerance)
     n_steps = int(np.floor((z_end - z_start) / z_step + 0.5)) + 1
-    return [z_start + i * z_step for i in range(n_steps)]
+    return z_start + np.arange(max(n_steps, 0), dtype=np.float64) * z_step
+
+
+def _grab_batch(camera: Any, n: int) -> np.ndarray:
+    """
+    Grab `n` frames as one (n, H, W[, C]) array.
+
+    Cameras may implement `grab_batch(n)` themselves (filling a reused
+    buffer); for any other backend I stack `grab_frame()` calls into a
+    fresh array.
+    """
+    if hasattr(camera, "grab_batch"):
+        batch = camera.grab_batch(n)
+        if batch is None:
+            raise RuntimeError("grab_batch() returned None.")
+        return batch
+
+    batch: Optional[np.ndarray] = None
+    for k in range(n):
+        frame = camera.grab_frame()
+        if frame is None:
+            raise RuntimeError("grab_frame() returned None.")
+        if batch is None:
+            batch = np.empty((n,) + frame.shape, dtype=frame.dtype)
+        batch[k] = frame
+    return batch
+
+
+# Settle wait for real stages when the config does not set one.
+_DEFAULT_SETTLE_TIMEOUT_S = 0.1
+
+
+def _settle_timeout_s(config: "FocusAndMTFHWConfig") -> float:
+    """Configured settle timeout; defaults to 0.1 s, or 0 for the dummy stage."""
+    if config.settle_timeout_s is not None:
+        return config.settle_timeout_s
+    if config.stage_backend.lower() == "dummy":
+        return 0.0
+    return _DEFAULT_SETTLE_TIMEOUT_S
+
+
+def _move_stage(stage: Any, z: float) -> float:
+    """Start a move to z; returns the time.monotonic() it was issued at."""
+    print(f"[focus-and-mtf-hw] Moving stage to z = {z}")
+    stage.move_to(z)
+    return time.monotonic()
+
+
+def _wait_until_settled(
+    stage: Any, timeout_s: float, moved_at: Optional[float] = None
+) -> None:
+    """
+    Wait until the stage reports it has settled, for at most `timeout_s`.
+
+    Stages may expose `is_settled() -> bool`; I poll it every millisecond
+    so a fast stage only costs its real settle time. A stage without that
+    method cannot tell me, so I wait out the whole timeout as before.
+
+    The timeout runs from `moved_at` (default: now), so time already spent
+    on other work since the move was issued counts towards settling.
+    """
+    if timeout_s <= 0:
+        return
+    deadline = (time.monotonic() if moved_at is None else moved_at) + timeout_s
+    is_settled = getattr(stage, "is_settled", None)
+    if is_settled is None:
+        time.sleep(max(0.0, deadline - time.monotonic()))
+        return
+    while not is_settled() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def _no_op() -> None:
+    pass
+
+
+class _GrayScratchRing:
+    """
+    Small ring of preallocated uint8 grayscale (K, H, W) buffers.
+
+    Instead of letting cvtColor (or a defensive copy) allocate fresh
+    arrays for every capture, I convert each grabbed batch into the next
+    buffer of the ring. The frame writer keeps references to queued
+    batches, so a buffer may only be reused once the writer is done with
+    it. Ring order alone does not guarantee that: with several writer
+    threads, one slow worker can still hold an old buffer while the others
+    drain the queue. So every buffer carries a "free" event that the writer
+    sets (through the `release` callback) when it has finished with the
+    batch, and `to_gray` waits for it before overwriting the buffer.
+
+    Sizing the ring one larger than `_FrameWriter.max_in_flight` means that
+    wait only ever blocks behind a genuinely slow write.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = max(2, int(size))
+        self._bufs: List[np.ndarray] = []
+        self._free: List[threading.Event] = []
+        self._next = 0
+
+    def to_gray(self, batch: np.ndarray) -> Tuple[np.ndarray, Callable[[], None]]:
+        """
+        Return a (K, H, W[, 3]) batch as grayscale uint8 in the next buffer.
+
+        Also returns the callback that releases the buffer again; pass it
+        to `_FrameWriter.put_batch(..., on_done=...)`.
+        """
+        if batch.ndim == 3 and batch.dtype != np.uint8:
+            # Not regular 8-bit frames: keep their dtype, as before.
+            return batch.copy(), _no_op
+
+        shape = batch.shape[:3]
+        if not self._bufs or self._bufs[0].shape != shape:
+            # First batch (or a resolution change): size the ring from it.
+            # Old buffers still queued stay alive through the writer.
+            self._bufs = [np.empty(shape, dtype=np.uint8) for _ in range(self._size)]
+            self._free = [threading.Event() for _ in range(self._size)]
+            for event in self._free:
+                event.set()
+            self._next = 0
+
+        buf = self._bufs[self._next]
+        free = self._free[self._next]
+        self._next = (self._next + 1) % self._size
+
+        free.wait()  # the writer may still be encoding this buffer
+        free.clear()
+        if batch.ndim == 4:
+            for frame, out in zip(batch, buf):
+                cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=out)
+        else:
+            np.copyto(buf, batch)
+        return buf, free.set
+
+
+def _capture_position(
+    camera: Any,
+    stage: Any,
+    writer: _FrameWriter,
+    scratch: _GrayScratchRing,
+    frames_dir: Path,
+    config: "FocusAndMTFHWConfig",
+    idx_z: int,
+    z: float,
+    moved_at: Optional[float] = None,
+    next_z: Optional[float] = None,
+) -> Tuple[np.ndarray, Optional[float]]:
+    """
+    Move to z, grab `frames_per_step` frames and queue them for writing.
+
+    For a pipelined sweep the caller passes `moved_at` (the move to z was
+    already issued, see `_move_stage`) and `next_z`: as soon as the frames
+    are grabbed I start the move to `next_z`, so it settles while this
+    batch is converted and queued (and the writer threads encode it).
+
+    Returns the last grayscale frame, so adaptive sweeps can score the
+    position right away, and the time the move to `next_z` was issued (None
+    without `next_z`). The frame lives in `scratch` and stays valid until
+    the next capture, so callers must not hold on to it.
+    """
+    if moved_at is None:
+        moved_at = _move_stage(stage, z)
+    _wait_until_settled(stage, _settle_timeout_s(config), moved_at)
+
+    n = config.frames_per_step
+    batch = _grab_batch(camera, n)
+
+    # The frames are in memory, so the stage is free to go.
+    next_moved_at = None if next_z is None else _move_stage(stage, next_z)
+
+    # Ensure grayscale uint8. The writer thread keeps the array, and
+    # the camera reuses its own buffer, so the batch always lands in one
+    # of our scratch buffers first.
+    gray, release = scratch.to_gray(batch)
+
+    stem = f"z{z:0.4f}_idx{idx_z:03d}"
+    paths = [
+        frames_dir / f"{stem}_f{k:02d}.{config.frame_format}" for k in range(n)
+    ]
+    meta = [{"z": z, "idx": idx_z, "k": k} for k in range(n)]
+    writer.put_batch(paths, gray, meta, on_done=release)
+
+    return gray[-1], next_moved_at
+
+
+def _focus_metric_fn(config: "FocusAndMTFHWConfig") -> Callable[[np.ndarray], float]:
+    """Focus metric used to score frames during a sweep, chosen by target."""
+    from .metrics import siemens_focus_metric, tenengrad
+
+    return siemens_focus_metric if config.target == "siemens" else tenengrad
+
+
+# Early stop of a uniform sweep: after at least this many positions, stop
+# once the last three metrics strictly decrease and the latest has dropped
+# below this fraction of the best so far.
+_EARLY_STOP_MIN_POINTS = 5
+_EARLY_STOP_DROP = 0.7
+
+
+def _past_peak(metrics: List[float]) -> bool:
+    """
+    True once a sweep's focus metric has clearly passed its peak.
+
+    This is a cheap test for unimodal metrics: a steady decline well below
+    the maximum means the rest of the sweep only samples the far tail.
+    """
+    if len(metrics) < _EARLY_STOP_MIN_POINTS:
+        return False
+    a, b, c = metrics[-3:]
+    return a > b > c and c < _EARLY_STOP_DROP * max(metrics)
+
+
+# Number of points in the coarse pass of an adaptive sweep.
+_ADAPTIVE_COARSE_POINTS = 5
+
+
+def _load_last_focus(path: Path) -> Optional[float]:
+    """Best z saved by a previous adaptive run, or None."""
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            return float(json.load(f)["best_z"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _adaptive_sweep(
+    capture: Any,
+    config: "FocusAndMTFHWConfig",
+    last_focus_path: Path,
+) -> tuple[List[float], List[float], float]:
+    """
+    Coarse sweep -> spline peak -> fine sweep around the peak.
+
+    Instead of capturing every uniform z, I:
+      1) capture ~5 coarse positions (centered on the last saved peak if
+         there is one, otherwise spread over the whole range),
+      2) score each frame immediately (Siemens or plain Tenengrad),
+      3) fit a cubic spline to metric(z) and maximize it,
+      4) capture a fine sweep of ±2 * z_step around that peak,
+    and save the final best z to `last_focus.json` for the next run.
+
+    `capture(idx, z)` moves, grabs, queues frames and returns the last
+    grayscale frame. Returns (positions, metrics, best_z) in capture order.
+    """
+    from scipy.interpolate import UnivariateSpline
+    from scipy.optimize import minimize_scalar
+
+    metric_fn = _focus_metric_fn(config)
+
+    lo, hi = sorted((float(config.z_start), float(config.z_end)))
+    step = abs(float(config.z_step))
+
+    seed = _load_last_focus(last_focus_path)
+    if seed is not None and lo <= seed <= hi:
+        # Re-run: the peak rarely moves far, so search half the range around it.
+        half = (hi - lo) / 4.0
+        c_lo, c_hi = max(lo, seed - half), min(hi, seed + half)
+        print(f"[focus-and-mtf-hw] Adaptive sweep seeded at z = {seed}")
+    else:
+        c_lo, c_hi = lo, hi
+    coarse = np.linspace(c_lo, c_hi, _ADAPTIVE_COARSE_POINTS).tolist()
+
+    positions: List[float] = []
+    metrics: List[float] = []
+
+    def visit(z: float) -> None:
+        img = capture(len(positions), z)
+        positions.append(z)
+        metrics.append(float(metric_fn(img)))
+
+    for z in coarse:
+        visit(z)
+
+    # Peak of a cubic interpolating spline through the coarse samples
+    zs = np.asarray(positions)
+    ms = np.asarray(metrics)
+    order = np.argsort(zs)
+    zs, ms = zs[order], ms[order]
+    if np.unique(zs).size >= 4:
+        spline = UnivariateSpline(zs, ms, k=3, s=0)
+        res = minimize_scalar(
+            lambda z: -float(spline(z)), bounds=(zs[0], zs[-1]), method="bounded"
+        )
+        z_peak = float(res.x)
+    else:
+        z_peak = float(zs[np.argmax(ms)])
+    print(f"[focus-and-mtf-hw] Coarse spline peak at z = {z_peak:.4f}")
+
+    # Fine sweep around the estimated peak, skipping already-visited z
+    for z in (z_peak + step * np.arange(-2, 3)).tolist():
+        if lo <= z <= hi and not any(abs(z - p) < 1e-9 for p in positions):
+            visit(z)
+
+    best_z = positions[int(np.argmax(metrics))]
+    _write_json(last_focus_path, {"best_z": best_z, "metric": max(metrics)})
+    print(f"[focus-and-mtf-hw] Adaptive best z = {best_z} (saved {last_focus_path})")
+
+    return positions, metrics, best_z
 
 
 def run_focus_and_mtf_hw(config: "FocusAndMTFHWConfig") -> int:
@@ -228,14 +938,17 @@ def run_focus_and_mtf_hw(config: "FocusAndMTFHWConfig") -> int:
 
     High-level steps:
       1) Create output folders.
-      2) Compute stage positions.
+      2) Compute stage positions (the uniform plan; an adaptive run visits
+         a coarse pass plus a fine pass around the spline peak instead,
+         see `_adaptive_sweep`).
       3) If dry_run: print plan and write JSON, then return.
       4) Open camera and stage backends.
       5) For each position:
            - move stage
            - optionally wait for settle
            - grab frames
-           - save images to disk
+           - hand them to a background writer thread (PNG, or raw .npy
+             with frame_format="npy", to disk)
       6) Write a simple run summary JSON.
       7) (Future) trigger Siemens/edge MTF analysis on best frame(s).
 
@@ -245,8 +958,10 @@ def run_focus_and_mtf_hw(config: "FocusAndMTFHWConfig") -> int:
     """
     out_dir: Path = config.out_dir
     out_dir.mkdir(parents=True, exist_ok=True)
+    # With a container the per-frame names only label the index entries.
     frames_dir = out_dir / "frames"
-    frames_dir.mkdir(exist_ok=True)
+    if config.container == "frames":
+        frames_dir.mkdir(exist_ok=True)
 
     print("[focus-and-mtf-hw] Starting hardware run.")
     print(f"[focus-and-mtf-hw] Camera backend : {config.camera_backend}")
@@ -256,11 +971,32 @@ def run_focus_and_mtf_hw(config: "FocusAndMTFHWConfig") -> int:
     print(f"[focus-and-mtf-hw] frames/step    : {config.frames_per_step}")
     print(f"[focus-and-mtf-hw] exposure [ms]  : {config.exposure_ms}")
     print(f"[focus-and-mtf-hw] target         : {config.target}")
+    print(f"[focus-and-mtf-hw] frame format   : {config.frame_format}")
+    print(f"[focus-and-mtf-hw] container      : {config.container}")
+    print(f"[focus-and-mtf-hw] adaptive       : {config.adaptive}")
+    print(f"[focus-and-mtf-hw] early stop     : {config.early_stop}")
+    print(f"[focus-and-mtf-hw] settle [s]     : {_settle_timeout_s(config)}")
     print(f"[focus-and-mtf-hw] out_dir        : {out_dir}")
     print(f"[focus-and-mtf-hw] dry_run        : {config.dry_run}")
 
+    if config.settle_timeout_s is not None and config.settle_timeout_s < 0:
+        raise ValueError("settle_timeout_s must be non-negative.")
+    if config.frames_per_step < 1:
+        raise ValueError("frames_per_step must be at least 1.")
+    if config.png_compression is not None and not 0 <= config.png_compression <= 9:
+        raise ValueError("png_compression must be between 0 and 9.")
+    if config.frame_format not in ("png", "npy"):
+        raise ValueError(
+            f"frame_format must be 'png' or 'npy', got {config.frame_format!r}"
+        )
+    if config.container not in ("frames", "npy", "h5"):
+        raise ValueError(
+            f"container must be 'frames', 'npy' or 'h5', got {config.container!r}"
+        )
+
     positions = _compute_positions(config.z_start, config.z_end, config.z_step)
-    print(f"[focus-and-mtf-hw] Planned positions ({len(positions)}): {positions}")
+    positions_list = positions.tolist()  # plain floats for JSON and drivers
+    print(f"[focus-and-mtf-hw] Planned positions ({len(positions)}): {positions_list}")
 
     # Save the planned run as JSON (useful even in dry runs)
     plan_path = out_dir / "plan_focus_sweep.json"
@@ -275,10 +1011,15 @@ def run_focus_and_mtf_hw(config: "FocusAndMTFHWConfig") -> int:
         "exposure_ms": config.exposure_ms,
         "gain": config.gain,
         "target": config.target,
+        "frame_format": config.frame_format,
+        "container": config.container,
+        "png_compression": config.png_compression,
+        "adaptive": config.adaptive,
+        "early_stop": config.early_stop,
+        "settle_timeout_s": _settle_timeout_s(config),
         "dry_run": config.dry_run,
     }
-    with plan_path.open("w", encoding="utf-8") as f:
-        json.dump(plan, f, indent=2)
+    _write_json(plan_path, plan)
     print(f"[focus-and-mtf-hw] Saved plan JSON: {plan_path}")
 
     if config.dry_run:
@@ -289,46 +1030,90 @@ def run_focus_and_mtf_hw(config: "FocusAndMTFHWConfig") -> int:
     camera = _open_camera(config.camera_backend, config)
     stage = _open_stage(config.stage_backend, config)
 
-    camera.open()
+    if config.container == "frames":
+        writer = _FrameWriter(
+            maxsize=8,
+            n_workers=os.cpu_count() or 1,
+            png_compression=config.png_compression,
+        )
+    else:
+        writer = _ContainerWriter(
+            out_dir / f"frames.{config.container}", config.container, maxsize=8
+        )
+    # One buffer more than the writer can hold, so waiting for a buffer to
+    # be released (see _GrayScratchRing) is rare.
+    scratch = _GrayScratchRing(writer.max_in_flight + 1)
     try:
-        # Optional: initial move to z_start
-        for idx_z, z in enumerate(positions):
-            print(f"[focus-and-mtf-hw] Moving stage to z = {z}")
-            stage.move_to(z)
-
-            # I keep this settle time simple for now; if I move to a real
-            # precision stage later, I can replace this with a status poll.
-            time.sleep(0.1)
-
-            for k in range(config.frames_per_step):
-                frame = camera.grab_frame()
-                if frame is None:
-                    raise RuntimeError("grab_frame() returned None.")
-
-                # Ensure grayscale uint8
-                if frame.ndim == 3:
-                    frame_gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                else:
-                    frame_gray = frame
-
-                fname = frames_dir / f"z{z:0.4f}_idx{idx_z:03d}_f{k:02d}.png"
-                cv2.imwrite(str(fname), frame_gray)
-                print(f"[focus-and-mtf-hw] Saved frame: {fname}")
+        camera.open()
+
+        def capture(idx_z: int, z: float) -> np.ndarray:
+            gray, _ = _capture_position(
+                camera, stage, writer, scratch, frames_dir, config, idx_z, z
+            )
+            return gray
+
+        adaptive_result = None
+        early_stop_result = None
+        if config.adaptive:
+            visited, metrics, best_z = _adaptive_sweep(
+                capture, config, out_dir / "last_focus.json"
+            )
+            adaptive_result = {"metrics": metrics, "best_z": best_z}
+            positions_list = visited
+        elif positions_list:
+            # Pipelined: each position's capture issues the next move, and
+            # the first move goes out before the loop.
+            metric_fn = _focus_metric_fn(config) if config.early_stop else None
+            sweep_metrics: List[float] = []
+            stopped = False
+            moved_at = _move_stage(stage, positions_list[0])
+            for idx_z, z in enumerate(positions_list):
+                next_z = (
+                    positions_list[idx_z + 1]
+                    if idx_z + 1 < len(positions_list) else None
+                )
+                gray, moved_at = _capture_position(
+                    camera, stage, writer, scratch, frames_dir, config,
+                    idx_z, z, moved_at=moved_at, next_z=next_z,
+                )
+                if metric_fn is None:
+                    continue
+                sweep_metrics.append(float(metric_fn(gray)))
+                if _past_peak(sweep_metrics):
+                    # The move to next_z is already under way; it is simply
+                    # not captured.
+                    print(f"[focus-and-mtf-hw] Metric past its peak at z = {z}; stopping early.")
+                    positions_list = positions_list[:idx_z + 1]
+                    stopped = True
+                    break
+            if metric_fn is not None:
+                early_stop_result = {"metrics": sweep_metrics, "early_stop": stopped}
+
+        # Every frame must be on disk before the summary is written.
+        writer.close()
 
         # Simple summary JSON (placeholder for future MTF results)
         summary = {
-            "positions": positions,
+            "positions": positions_list,
             "frames_per_step": config.frames_per_step,
-            "n_positions": len(positions),
-            "n_frames_total": len(positions) * config.frames_per_step,
+            "n_positions": len(positions_list),
+            "n_frames_total": len(positions_list) * config.frames_per_step,
             "target": config.target,
+            "adaptive": config.adaptive,
+            "container": config.container,
         }
+        if adaptive_result is not None:
+            summary.update(adaptive_result)
+        if early_stop_result is not None:
+            summary.update(early_stop_result)
         summary_path = out_dir / "run_summary.json"
-        with summary_path.open("w", encoding="utf-8") as f:
-            json.dump(summary, f, indent=2)
+        _write_json(summary_path, summary)
         print(f"[focus-and-mtf-hw] Saved summary JSON: {summary_path}")
 
     finally:
+        # Normal runs already flushed above; on an error path this still
+        # stops the writer thread before the camera goes away.
+        writer.close(raise_errors=False)
         camera.close()
 
     print("[focus-and-mtf-hw] Completed hardware capture.")
@@ -32,20 +32,25 @@ class DummyCamera(Camera):
     def __init__(self, stage: MockStage):
         self.stage = stage
 
+        # Base synthetic 1D edge expanded into 2D. It never changes, so I
+        # build it (and its in-focus uint8 version) once.
+        self._base = np.zeros((64, 64), dtype=np.float64)
+        self._base[:, 32:] = 255.0
+        self._base_u8 = self._base.astype("uint8")
+        self._blurred = np.empty_like(self._base)
+
     def grab(self) -> np.ndarray:
         z = self.stage.position()
 
-        # Base synthetic 1D edge expanded into 2D
-        img = np.zeros((64, 64), dtype=np.float64)
-        img[:, 32:] = 255.0
-
         # Blur scales with distance from best focus (z = 200)
         sigma = abs(z - 200.0) / 100.0
-        if sigma > 0:
-            ksize = 9
-            img = cv2.GaussianBlur(img, (ksize, ksize), sigmaX=sigma)
+        if sigma <= 0:
+            return self._base_u8.copy()
 
-        return img.astype("uint8")
+        # Kernel covers ±3 sigma, so small blurs stay cheap.
+        ksize = 2 * int(3 * sigma) + 1
+        cv2.GaussianBlur(self._base, (ksize, ksize), sigmaX=sigma, dst=self._blurred)
+        return self._blurred.astype("uint8")
 
 
 def main() -> None:
@@ -6,12 +6,39 @@ on a set of Siemens-star images without going through the CLI.
 
 Example usage:
     python -m bench.manual_af_siemens_stack
+    python -m bench.manual_af_siemens_stack --force   # ignore the cache
+
+The metric curve is cached under ~/.cache/camera-mtf-bench, keyed by the
+stack's file list and mtimes, so repeated runs on an unchanged stack skip
+decoding and scoring the frames.
 """
 
 from __future__ import annotations
 
+import argparse
+import hashlib
+import os
+from pathlib import Path
+
 import numpy as np
 from bench.autofocus import scan_autofocus_stack_siemens
+from bench.instruments import list_stack_files
+
+
+def _cache_path(files: list, z_start_um: float, z_end_um: float) -> Path:
+    """
+    Cache file for this stack + z range.
+
+    The key hashes every frame's path, size and mtime, so touching,
+    adding or removing a frame invalidates the cached curve.
+    """
+    h = hashlib.sha1(f"{z_start_um!r}|{z_end_um!r}".encode())
+    for path in files:
+        st = os.stat(path)
+        h.update(f"|{path}|{st.st_size}|{st.st_mtime_ns}".encode())
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return Path(cache_home) / "camera-mtf-bench" / f"{h.hexdigest()}.npz"
 
 
 def main() -> None:
@@ -21,27 +48,51 @@ def main() -> None:
     I use this script whenever I want to sanity-check the autofocus
     algorithm or quickly visualize the metric curve.
     """
-    pattern = "data/focus_stack/*.png"
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pattern", default="data/focus_stack/*.png")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Recompute the metric curve even if a cached one exists.",
+    )
+    args = parser.parse_args()
+
+    pattern = args.pattern
     z_start_um = -200.0
     z_end_um = 200.0
 
-    result = scan_autofocus_stack_siemens(
-        stack_pattern=pattern,
-        z_start_um=z_start_um,
-        z_end_um=z_end_um,
-    )
+    # List (and sort) the stack once; the same ordered list feeds both the
+    # cache key and the scan.
+    files = list_stack_files(pattern)
+    cache_path = _cache_path(files, z_start_um, z_end_um)
+    if cache_path.exists() and not args.force:
+        with np.load(cache_path) as cached:
+            positions_um = cached["positions_um"]
+            metrics = cached["metrics"]
+        print("Loaded cached metric curve:", cache_path)
+    else:
+        result = scan_autofocus_stack_siemens(
+            stack_pattern=files,
+            z_start_um=z_start_um,
+            z_end_um=z_end_um,
+        )
+        positions_um = np.asarray(result.positions_um, dtype=float)
+        metrics = np.asarray(result.metrics, dtype=float)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(cache_path, positions_um=positions_um, metrics=metrics)
 
-    print("Best z [µm]:", result.best_z_um)
-    print("Best metric:", result.best_metric)
-    print("All positions:", result.positions_um)
-    print("All metrics:", result.metrics)
+    best = int(np.argmax(metrics))
+    print("Best z [µm]:", positions_um[best])
+    print("Best metric:", metrics[best])
+    print("All positions:", positions_um)
+    print("All metrics:", metrics)
 
     # Optional: visualize the autofocus curve
     try:
         import matplotlib.pyplot as plt
 
         plt.figure()
-        plt.plot(result.positions_um, result.metrics, marker="o")
+        plt.plot(positions_um, metrics, marker="o")
         plt.xlabel("Stage position [µm]")
         plt.ylabel("Siemens focus metric")
         plt.title("Autofocus scan on Siemens focus stack")